@@ -4,8 +4,9 @@ Code and Git analyzers for the Self-Development Organism system.
 
 import ast
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from models import (
     FileAnalysis,
@@ -16,6 +17,15 @@ from models import (
 )
 
 
+# Every perspective builds its own CodeAnalyzer over the same tree, so
+# parse results are shared process-wide and a full run parses each file
+# once. Entries are keyed on the file's stat so edits are picked up, hold
+# only root-independent measurements (issues as a tuple), and are evicted
+# least-recently-used first. Callers always get a fresh FileAnalysis.
+_ANALYSIS_CACHE: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+_ANALYSIS_CACHE_MAX = 4096
+
+
 class CodeAnalyzer:
     """Analyzes code structure and metrics"""
 
@@ -24,24 +34,52 @@ class CodeAnalyzer:
         self.file_analyses: Dict[str, FileAnalysis] = {}
 
     def analyze_file(self, file_path: Path) -> Optional[FileAnalysis]:
-        """Analyze a single Python file"""
-        if not file_path.exists() or not file_path.suffix == ".py":
+        """Analyze a single Python file, reusing the parse while it is unchanged"""
+        if not file_path.suffix == ".py":
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
+        # ctime and inode catch same-size rewrites within one mtime tick.
+        key = (str(file_path), stat.st_mtime_ns, stat.st_ctime_ns,
+               stat.st_ino, stat.st_size, MAX_FILE_LINES, COMPLEXITY_THRESHOLD)
+        measured = _ANALYSIS_CACHE.get(key)
+        if measured is None:
+            measured = self._measure_source(file_path)
+            _ANALYSIS_CACHE[key] = measured
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+                _ANALYSIS_CACHE.popitem(last=False)
+        else:
+            _ANALYSIS_CACHE.move_to_end(key)
+
+        parsed, lines, functions, classes, imports, complexity, issues = measured
+        rel_path = str(file_path.relative_to(self.root_dir))
+        has_tests = parsed and (
+            any(td in rel_path for td in TEST_DIRS) or "test" in file_path.name.lower())
+        return FileAnalysis(
+            path=rel_path,
+            lines=lines,
+            functions=functions,
+            classes=classes,
+            imports=imports,
+            complexity=complexity,
+            has_tests=has_tests,
+            issues=list(issues)
+        )
+
+    def _measure_source(self, file_path: Path) -> Tuple:
+        """Parse and measure a Python file that is known to exist.
+
+        Returns ``(parsed, lines, functions, classes, imports, complexity,
+        issues)``; nothing in it depends on the analyzer's root.
+        """
         try:
             content = file_path.read_text(encoding="utf-8")
             tree = ast.parse(content)
         except (SyntaxError, UnicodeDecodeError):
-            return FileAnalysis(
-                path=str(file_path.relative_to(self.root_dir)),
-                lines=0,
-                functions=0,
-                classes=0,
-                imports=0,
-                complexity=0,
-                has_tests=False,
-                issues=["Syntax error in file"]
-            )
+            return (False, 0, 0, 0, 0, 0, ("Syntax error in file",))
 
         lines = len(content.splitlines())
         functions = sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
@@ -50,25 +88,13 @@ class CodeAnalyzer:
 
         complexity = self._calculate_complexity(tree)
 
-        rel_path = str(file_path.relative_to(self.root_dir))
-        has_tests = any(td in rel_path for td in TEST_DIRS) or "test" in file_path.name.lower()
-
         issues = []
         if lines > MAX_FILE_LINES:
             issues.append(f"File too long: {lines} lines (max {MAX_FILE_LINES})")
         if complexity > COMPLEXITY_THRESHOLD:
             issues.append(f"High complexity: {complexity:.1f} (max {COMPLEXITY_THRESHOLD})")
 
-        return FileAnalysis(
-            path=rel_path,
-            lines=lines,
-            functions=functions,
-            classes=classes,
-            imports=imports,
-            complexity=complexity,
-            has_tests=has_tests,
-            issues=issues
-        )
+        return (True, lines, functions, classes, imports, complexity, tuple(issues))
 
     def _calculate_complexity(self, tree: ast.AST) -> float:
         """Calculate simplified cyclomatic complexity"""
@@ -4,6 +4,7 @@ Analytics (trends/patterns) and Debug (issues/TODOs) perspectives.
 """
 
 import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -17,6 +18,21 @@ from models import (
 from perspectives import PerspectiveAnalyzer
 
 
+# [^\S\n] is whitespace other than newline, so a bare "# TODO" never
+# takes its text from the following line.
+_TODO_RE = re.compile(
+    r'#[^\S\n]*(TODO|FIXME|XXX|HACK|BUG)(?:[^\S\n]|:)*(.*)', re.IGNORECASE)
+_MAX_TODO_SCAN_BYTES = 2_000_000
+
+# Per-file TODO scan results, keyed like analyzers._ANALYSIS_CACHE on the
+# absolute path that is stat'ed, so analyzers on different roots never
+# share entries, and on the file's stat (mtime, ctime, inode and size) so
+# edits are picked up. The oldest entry is dropped first once the cache is
+# full, and callers get copies of the cached markers.
+_TODO_CACHE: "OrderedDict[Tuple, List[dict]]" = OrderedDict()
+_TODO_CACHE_MAX = 4096
+
+
 class AnalyticsPerspective(PerspectiveAnalyzer):
     """Analyzes trends and patterns"""
 
@@ -191,33 +207,59 @@ class DebugPerspective(PerspectiveAnalyzer):
 
     def _find_todo_comments(self) -> List[dict]:
         """Scan source directories for TODO/FIXME comments, skipping test files"""
-        todo_pattern = re.compile(r'#\s*(TODO|FIXME|XXX|HACK|BUG)[\s:]*(.*)', re.IGNORECASE)
         todos = []
 
         analyses = self.code_analyzer.get_all_analyses()
         for file_path_str in analyses.keys():
-            file_path = self.root_dir / file_path_str
-            if not file_path.exists():
-                continue
-            # Skip test files — markers inside them are test fixtures, not real issues
-            if file_path.name.startswith("test_") or "/tests/" in str(file_path):
+            rel_path = Path(file_path_str)
+            # Skip test files — markers inside them are test fixtures, not real issues.
+            # Only the path below root counts, so a root that itself lives
+            # under a tests/ directory is still scanned.
+            if rel_path.name.startswith("test_") or "tests" in rel_path.parts:
                 continue
+            file_path = self.root_dir / rel_path
             try:
-                content = file_path.read_text()
-                for i, line in enumerate(content.splitlines(), 1):
-                    match = todo_pattern.search(line)
-                    if match:
-                        todos.append({
-                            "file": str(file_path.relative_to(self.root_dir)),
-                            "line": i,
-                            "type": match.group(1).upper(),
-                            "text": match.group(2).strip()
-                        })
-            except Exception:
+                stat = file_path.stat()
+                # Huge generated modules hold no real TODOs; skip them
+                # before reading anything.
+                if stat.st_size > _MAX_TODO_SCAN_BYTES:
+                    continue
+                key = (str(file_path), stat.st_mtime_ns, stat.st_ctime_ns,
+                       stat.st_ino, stat.st_size)
+                found = _TODO_CACHE.get(key)
+                if found is None:
+                    found = self._scan_todo_file(file_path)
+                    _TODO_CACHE[key] = found
+                    if len(_TODO_CACHE) > _TODO_CACHE_MAX:
+                        _TODO_CACHE.popitem(last=False)
+            except OSError:
                 continue
+            todos.extend(dict(t) for t in found)
 
         return todos
 
+    def _scan_todo_file(self, file_path: Path) -> List[dict]:
+        """Return the TODO/FIXME markers in one file; binary files have none"""
+        data = file_path.read_bytes()
+        if b"\0" in data[:4096]:
+            return []
+        content = data.decode("utf-8", errors="replace")
+        rel_path = str(file_path.relative_to(self.root_dir))
+        found = []
+        # One pass over the whole file; line numbers are counted
+        # incrementally between matches.
+        line, pos = 1, 0
+        for match in _TODO_RE.finditer(content):
+            line += content.count("\n", pos, match.start())
+            pos = match.start()
+            found.append({
+                "file": rel_path,
+                "line": line,
+                "type": match.group(1).upper(),
+                "text": match.group(2).strip()
+            })
+        return found
+
     def _generate_todo_prompts(self, todos: List[dict], prompts: List[Prompt]):
         """Generate prompts for found TODO/FIXME comments"""
         for todo in todos[:10]:
@@ -21,6 +21,28 @@ _INCREMENT_STATUS_RE = re.compile(
     r"(?i)(^|[_-])(?P<status>todo|done)(?=$|[_-])"
 )
 
+# parse_increment patterns, compiled once at import.
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_ANY_HEADING_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_REQUIREMENT_ID_RE = re.compile(r'\*\*Requirement ID:\*\*\s*(\S+)')
+_HEADING_ID_RE = re.compile(r'([A-Z][A-Za-z0-9_]*(?:-\d+)?)\s*[:—–]\s')
+_DESCRIPTION_SECTION_RE = re.compile(
+    r'## Description\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+_PRINCIPLES_SECTION_RE = re.compile(
+    r'## Related Principles\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+_CRITERIA_SECTION_RE = re.compile(
+    r'## Acceptance Criteria\s*\n(.*?)(?=\n## |\Z)', re.DOTALL)
+_PRINCIPLES_BOLD_RE = re.compile(
+    r'\*\*Related Principles[^*]*\*\*:?\s*\n'
+    r'(.*?)(?=\n\*\*[A-Z]|\n#{1,6}\s|\n---|\Z)', re.DOTALL)
+_CRITERIA_BOLD_RE = re.compile(
+    r'\*\*Acceptance Criteria[^*]*\*\*:?\s*\n'
+    r'(.*?)(?=\n\*\*[A-Z]|\n#{1,6}\s|\n---|\Z)', re.DOTALL)
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_CHECKBOX_PREFIX_RE = re.compile(r'^-\s*\[[ x]\]\s*')
+_DASH_PREFIX_RE = re.compile(r'^-\s*')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+\.\s*')
+
 
 def _increment_number_from_name(filename: str) -> Optional[int]:
     """Return the first standalone 1-4 digit increment number."""
@@ -111,6 +133,8 @@ class IncrementTracker:
         r'\n\*\*Platform Reference[^*]*\*\*',
         r'\n---\s*$',
     ]
+    _SECTION_MARKER_RES = tuple(
+        re.compile(marker, re.MULTILINE) for marker in _SECTION_MARKERS)
 
     @staticmethod
     def parse_increment(path: Path) -> dict:
@@ -146,32 +170,24 @@ class IncrementTracker:
         # ----------------------------------------------------------
 
         # Title from single-# heading
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        title_match = _TITLE_RE.search(content)
         title = title_match.group(1).strip() if title_match else ""
 
         # Requirement ID from explicit tag
-        req_match = re.search(r'\*\*Requirement ID:\*\*\s*(\S+)', content)
+        req_match = _REQUIREMENT_ID_RE.search(content)
         requirement_id = req_match.group(1) if req_match else ""
 
         # Description from ``## Description`` section
         desc_section = ""
-        d_match = re.search(
-            r'## Description\s*\n(.*?)(?=\n## |\Z)',
-            content, re.DOTALL,
-        )
+        d_match = _DESCRIPTION_SECTION_RE.search(content)
         if d_match:
             desc_section = d_match.group(1).strip()
 
         # Related principles from ``## Related Principles`` section
         principles = []
-        princ_match = re.search(
-            r'## Related Principles\s*\n(.*?)(?=\n## |\Z)',
-            content, re.DOTALL,
-        )
+        princ_match = _PRINCIPLES_SECTION_RE.search(content)
         if princ_match:
-            for m in re.finditer(
-                r'\[([^\]]+)\]\(([^)]+)\)', princ_match.group(1)
-            ):
+            for m in _MARKDOWN_LINK_RE.finditer(princ_match.group(1)):
                 link_text = m.group(1)
                 link_path = m.group(2)
                 code = link_text.split("—")[0].split("–")[0].strip()
@@ -179,15 +195,12 @@ class IncrementTracker:
 
         # Acceptance criteria from ``## Acceptance Criteria`` section
         criteria = []
-        ac_match = re.search(
-            r'## Acceptance Criteria\s*\n(.*?)(?=\n## |\Z)',
-            content, re.DOTALL,
-        )
+        ac_match = _CRITERIA_SECTION_RE.search(content)
         if ac_match:
             for line in ac_match.group(1).strip().splitlines():
                 line = line.strip()
-                cleaned = re.sub(r'^-\s*\[[ x]\]\s*', '', line)
-                cleaned = re.sub(r'^-\s*', '', cleaned).strip()
+                cleaned = _CHECKBOX_PREFIX_RE.sub('', line)
+                cleaned = _DASH_PREFIX_RE.sub('', cleaned).strip()
                 if cleaned:
                     criteria.append(cleaned)
 
@@ -197,7 +210,7 @@ class IncrementTracker:
 
         # Title fallback: accept any heading level (##, ###, …)
         if not title:
-            any_heading = re.search(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
+            any_heading = _ANY_HEADING_RE.search(content)
             if any_heading:
                 title = any_heading.group(1).strip()
         if not title:
@@ -207,38 +220,28 @@ class IncrementTracker:
         # e.g. "### W6: Screenshot…" → requirement_id = "W6"
         # e.g. "### R1: Multi-Perspective…" → requirement_id = "R1"
         if not requirement_id and title:
-            id_match = re.match(
-                r'([A-Z][A-Za-z0-9_]*(?:-\d+)?)\s*[:—–]\s', title,
-            )
+            id_match = _HEADING_ID_RE.match(title)
             if id_match:
                 requirement_id = id_match.group(1)
 
         # Description fallback: body text between first heading and the
         # earliest known section marker (bold or heading style).
         if not desc_section:
-            first_heading = re.search(
-                r'^#{1,6}\s+.+$', content, re.MULTILINE,
-            )
+            first_heading = _ANY_HEADING_RE.search(content)
             if first_heading:
                 remaining = content[first_heading.end():]
                 earliest_pos = len(remaining)
-                for marker in IncrementTracker._SECTION_MARKERS:
-                    m = re.search(marker, remaining, re.MULTILINE)
+                for marker in IncrementTracker._SECTION_MARKER_RES:
+                    m = marker.search(remaining)
                     if m and m.start() < earliest_pos:
                         earliest_pos = m.start()
                 desc_section = remaining[:earliest_pos].strip()
 
         # Related principles fallback: ``**Related Principles:**`` bold
         if not principles:
-            princ_bold = re.search(
-                r'\*\*Related Principles[^*]*\*\*:?\s*\n'
-                r'(.*?)(?=\n\*\*[A-Z]|\n#{1,6}\s|\n---|\Z)',
-                content, re.DOTALL,
-            )
+            princ_bold = _PRINCIPLES_BOLD_RE.search(content)
             if princ_bold:
-                for m in re.finditer(
-                    r'\[([^\]]+)\]\(([^)]+)\)', princ_bold.group(1)
-                ):
+                for m in _MARKDOWN_LINK_RE.finditer(princ_bold.group(1)):
                     link_text = m.group(1)
                     link_path = m.group(2)
                     code = link_text.split("—")[0].split("–")[0].strip()
@@ -246,20 +249,16 @@ class IncrementTracker:
 
         # Acceptance criteria fallback: ``**Acceptance Criteria:**`` bold
         if not criteria:
-            ac_bold = re.search(
-                r'\*\*Acceptance Criteria[^*]*\*\*:?\s*\n'
-                r'(.*?)(?=\n\*\*[A-Z]|\n#{1,6}\s|\n---|\Z)',
-                content, re.DOTALL,
-            )
+            ac_bold = _CRITERIA_BOLD_RE.search(content)
             if ac_bold:
                 for line in ac_bold.group(1).strip().splitlines():
                     line = line.strip()
                     if not line:
                         continue
                     # Strip checkbox, dash, or numbered-list prefix
-                    cleaned = re.sub(r'^-\s*\[[ x]\]\s*', '', line)
-                    cleaned = re.sub(r'^-\s*', '', cleaned)
-                    cleaned = re.sub(r'^\d+\.\s*', '', cleaned).strip()
+                    cleaned = _CHECKBOX_PREFIX_RE.sub('', line)
+                    cleaned = _DASH_PREFIX_RE.sub('', cleaned)
+                    cleaned = _NUMBERED_PREFIX_RE.sub('', cleaned).strip()
                     if cleaned:
                         criteria.append(cleaned)
 
@@ -468,7 +467,7 @@ class IncrementTracker:
             if content is None:
                 continue
             # Extract title from first heading
-            title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+            title_match = _TITLE_RE.search(content)
             title = title_match.group(1).strip() if title_match else code
             results.append({
                 "code": code,
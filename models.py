@@ -6,7 +6,7 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Union
 from enum import Enum
 
 
@@ -47,10 +47,10 @@ def load_config(root_dir: Path = None) -> dict:
     config_path = root_dir / "selfdev_config.json"
     if config_path.exists():
         try:
-            with open(config_path, "r") as f:
+            with open(config_path, "r", encoding="utf-8") as f:
                 user_config = json.load(f)
             defaults.update(user_config)
-        except (json.JSONDecodeError, TypeError, OSError):
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, OSError):
             pass
     return defaults
 
@@ -130,25 +130,33 @@ class OrganismState:
     last_increment_shown: int = 0
 
     @classmethod
-    def load(cls, path: Path) -> "OrganismState":
-        """Load state from file or create new"""
-        if path.exists():
-            try:
-                with open(path, "r") as f:
+    def load(cls, path: Union[Path, TextIO]) -> "OrganismState":
+        """Load state from a file or open text stream, or create new"""
+        try:
+            if hasattr(path, "read"):
+                data = json.load(path)
+            elif path.exists():
+                with open(path, "r", encoding="utf-8") as f:
                     data = json.load(f)
+            else:
+                data = None
+            if data is not None:
                 # Filter to only known fields to avoid TypeError on unknown keys
                 known_fields = {f.name for f in cls.__dataclass_fields__.values()}
                 filtered = {k: v for k, v in data.items() if k in known_fields}
                 return cls(**filtered)
-            except (json.JSONDecodeError, TypeError, OSError):
-                pass
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, OSError):
+            pass
         return cls(created_at=datetime.now(timezone.utc).isoformat())
 
-    def save(self, path: Path) -> None:
-        """Save state to file"""
+    def save(self, path: Union[Path, TextIO]) -> None:
+        """Save state to a file or open text stream"""
         self.last_updated = datetime.now(timezone.utc).isoformat()
+        if hasattr(path, "write"):
+            json.dump(asdict(self), path, indent=2)
+            return
         try:
-            with open(path, "w") as f:
+            with open(path, "w", encoding="utf-8") as f:
                 json.dump(asdict(self), f, indent=2)
         except OSError as e:
             print(f"Warning: Could not save state to {path}: {e}")
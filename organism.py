@@ -88,6 +88,16 @@ class SelfDevelopmentOrganism:
         """Remove a perspective analyzer."""
         self.perspectives.pop(perspective, None)
 
+    def reset_state(self, state: OrganismState = None) -> None:
+        """Replace the organism state without rebuilding the perspectives.
+
+        Every registered perspective is rebound to the new state so that
+        they keep reading the same object as the organism.
+        """
+        self.state = state if state is not None else OrganismState()
+        for analyzer in self.perspectives.values():
+            analyzer.state = self.state
+
     def run_perspective(self, perspective: Perspective, print_results: bool = True) -> List[Prompt]:
         """Run analysis from a specific perspective.
 
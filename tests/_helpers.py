@@ -0,0 +1,56 @@
+"""Fixtures shared by the perspective, diagnostics and organism tests."""
+
+import atexit
+import shutil
+import tempfile
+
+
+class _StubGit:
+    """Hand-rolled GitAnalyzer stand-in; far cheaper than MagicMock(spec=...).
+
+    By default the repository has one non-fix commit, a clean working tree
+    and nothing changed in the last commit.
+    """
+
+    def __init__(self, commits=None, uncommitted=None, changed_files=None):
+        self._commits = commits if commits is not None else [
+            {"hash": "abc12345", "message": "Initial commit", "date": "2026-01-01"}
+        ]
+        self._uncommitted = [] if uncommitted is None else uncommitted
+        self._changed_files = [] if changed_files is None else changed_files
+
+    def get_current_hash(self):
+        return "abc12345"
+
+    def get_recent_commits(self, count=10):
+        return self._commits
+
+    def get_uncommitted_changes(self):
+        return self._uncommitted
+
+    def get_branch(self):
+        return "main"
+
+    def get_changed_files_in_last_commit(self):
+        return self._changed_files
+
+
+# Stateless, so every test that needs the default answers shares one.
+_STUB_GIT = _StubGit()
+
+
+def _mock_git_analyzer(**overrides):
+    """Return the shared default stub, or a new one built from overrides."""
+    if not overrides:
+        return _STUB_GIT
+    return _StubGit(**overrides)
+
+
+# One root per test process, removed in a single walk at interpreter exit;
+# tests make their own subdirectories inside it.
+_TEST_ROOT = tempfile.mkdtemp(prefix="selfdev-tests-")
+atexit.register(shutil.rmtree, _TEST_ROOT, ignore_errors=True)
+
+# Three steady generations: enough history to get past the
+# "insufficient history" branch. Read-only, so shared between tests.
+_FLAT_HISTORY = tuple({"overall": 0.5, "generation": i} for i in range(3))
@@ -1,8 +1,9 @@
 """Tests for CodeAnalyzer and GitAnalyzer."""
 
 import ast
+import os
+import shutil
 import tempfile
-import textwrap
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -12,223 +13,292 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from analyzers import CodeAnalyzer, GitAnalyzer
 
-
-class TestCodeAnalyzer(unittest.TestCase):
-
-    def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-        self.analyzer = CodeAnalyzer(Path(self.tmp_dir))
-
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmp_dir)
-
-    def _write_file(self, name, content):
-        path = Path(self.tmp_dir) / name
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(textwrap.dedent(content))
-        return path
+# Set SELFDEV_SKIP_SLOW=1 to leave out the tests that fork real git.
+_SKIP_SLOW = bool(os.environ.get("SELFDEV_SKIP_SLOW"))
+
+
+# Files analyzed one at a time by TestCodeAnalyzeFile; staged once per class.
+# Sources are written flush-left so they can be written out verbatim.
+_FILE_CORPUS = {
+    "simple.py": """\
+def hello():
+    return "world"
+""",
+    "with_class.py": """\
+class MyClass:
+    def method_a(self):
+        pass
+    def method_b(self):
+        pass
+""",
+    "complex.py": """\
+def process(x):
+    if x > 0:
+        if x > 10:
+            return "big"
+        else:
+            return "small"
+    elif x == 0:
+        return "zero"
+    else:
+        for i in range(abs(x)):
+            if i % 2 == 0:
+                print(i)
+    return None
+""",
+    "readme.md": "# Hello",
+    "broken.py": """\
+def broken(
+    # missing closing paren
+""",
+    "long.py": "\n".join(["x = 1"] * 350),
+    "tests/test_something.py": "def test_it(): pass",
+    "imports.py": """\
+import os
+import sys
+from pathlib import Path
+""",
+    "multi_class.py": """\
+class A:
+    def method(self):
+        pass
+class B:
+    def method(self):
+        pass
+class C:
+    pass
+""",
+    "high_complexity.py": "def func():\n" + "".join(
+        f"    if x == {i}:\n        return {i}\n" for i in range(15)),
+    "module.py": "def func(): pass",
+    "__tests__/my_test.py": "def test_it(): pass",
+    "empty.py": "",
+}
+
+
+# _calculate_complexity only walks the tree, so each one is parsed once.
+_COMPLEXITY_TREE = ast.parse(
+    "if True:\n    for x in y:\n        while z:\n            pass")
+_BOOLOP_TREE = ast.parse("if a and b and c:\n    pass")
+_EXCEPT_TREE = ast.parse(
+    "try:\n    pass\nexcept ValueError:\n    pass\nexcept TypeError:\n    pass")
+
+
+class TestCodeAnalyzeFile(unittest.TestCase):
+    """analyze_file and complexity checks against one shared, read-only corpus."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._root = Path(tempfile.mkdtemp())
+        for name, content in _FILE_CORPUS.items():
+            path = cls._root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        cls.analyzer = CodeAnalyzer(cls._root)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
+
+    def _analyze(self, name):
+        return self.analyzer.analyze_file(self._root / name)
 
     def test_analyze_simple_file(self):
-        path = self._write_file("simple.py", """\
-            def hello():
-                return "world"
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("simple.py")
         self.assertIsNotNone(result)
         self.assertEqual(result.functions, 1)
         self.assertEqual(result.classes, 0)
         self.assertGreater(result.lines, 0)
 
     def test_analyze_file_with_class(self):
-        path = self._write_file("with_class.py", """\
-            class MyClass:
-                def method_a(self):
-                    pass
-                def method_b(self):
-                    pass
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("with_class.py")
         self.assertEqual(result.classes, 1)
         self.assertEqual(result.functions, 2)
 
     def test_analyze_file_complexity(self):
-        path = self._write_file("complex.py", """\
-            def process(x):
-                if x > 0:
-                    if x > 10:
-                        return "big"
-                    else:
-                        return "small"
-                elif x == 0:
-                    return "zero"
-                else:
-                    for i in range(abs(x)):
-                        if i % 2 == 0:
-                            print(i)
-                return None
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("complex.py")
         self.assertGreater(result.complexity, 1)
 
     def test_analyze_nonexistent_file(self):
-        path = Path(self.tmp_dir) / "nonexistent.py"
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("nonexistent.py")
         self.assertIsNone(result)
 
     def test_analyze_non_python_file(self):
-        path = self._write_file("readme.md", "# Hello")
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("readme.md")
         self.assertIsNone(result)
 
     def test_analyze_syntax_error_file(self):
-        path = self._write_file("broken.py", """\
-            def broken(
-                # missing closing paren
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("broken.py")
         self.assertIsNotNone(result)
         self.assertIn("Syntax error in file", result.issues)
 
-    def test_analyze_directory(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "a.py").write_text("def a(): pass")
-        (src / "b.py").write_text("def b(): pass")
-        results = self.analyzer.analyze_directory(src)
-        self.assertEqual(len(results), 2)
-
-    def test_analyze_directory_nonexistent(self):
-        results = self.analyzer.analyze_directory(Path(self.tmp_dir) / "nope")
-        self.assertEqual(len(results), 0)
-
     def test_analyze_file_long_file_issue(self):
-        lines = ["x = 1"] * 350
-        path = self._write_file("long.py", "\n".join(lines))
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("long.py")
         self.assertTrue(any("too long" in issue for issue in result.issues))
 
     def test_has_tests_detection(self):
-        test_dir = Path(self.tmp_dir) / "tests"
-        test_dir.mkdir()
-        path = test_dir / "test_something.py"
-        path.write_text("def test_it(): pass")
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("tests/test_something.py")
         self.assertTrue(result.has_tests)
 
-    def test_get_all_analyses(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "module.py").write_text("def func(): pass")
-        results = self.analyzer.get_all_analyses()
-        self.assertGreaterEqual(len(results), 1)
-
     def test_complexity_calculation(self):
-        code = "if True:\n    for x in y:\n        while z:\n            pass"
-        tree = ast.parse(code)
-        complexity = self.analyzer._calculate_complexity(tree)
+        complexity = self.analyzer._calculate_complexity(_COMPLEXITY_TREE)
         # 1 (base) + 1 (if) + 1 (for) + 1 (while) = 4
         self.assertEqual(complexity, 4)
 
     def test_imports_counted(self):
-        path = self._write_file("imports.py", """\
-            import os
-            import sys
-            from pathlib import Path
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("imports.py")
         self.assertEqual(result.imports, 3)
 
-    def test_pycache_excluded(self):
-        cache_dir = Path(self.tmp_dir) / "src" / "__pycache__"
-        cache_dir.mkdir(parents=True)
-        (cache_dir / "module.cpython-311.py").write_text("x = 1")
-        src = Path(self.tmp_dir) / "src"
-        results = self.analyzer.analyze_directory(src)
-        self.assertEqual(len(results), 0)
-
     def test_boolop_complexity(self):
         """BoolOp adds (len(values) - 1) to complexity."""
-        code = "if a and b and c:\n    pass"
-        tree = ast.parse(code)
-        complexity = self.analyzer._calculate_complexity(tree)
+        complexity = self.analyzer._calculate_complexity(_BOOLOP_TREE)
         # 1 (base) + 1 (if) + 2 (and with 3 values => 3-1=2) = 4
         self.assertEqual(complexity, 4)
 
     def test_except_handler_complexity(self):
-        code = "try:\n    pass\nexcept ValueError:\n    pass\nexcept TypeError:\n    pass"
-        tree = ast.parse(code)
-        complexity = self.analyzer._calculate_complexity(tree)
+        complexity = self.analyzer._calculate_complexity(_EXCEPT_TREE)
         # 1 (base) + 2 (except handlers) = 3
         self.assertEqual(complexity, 3)
 
     def test_multiple_classes(self):
-        path = self._write_file("multi_class.py", """\
-            class A:
-                def method(self):
-                    pass
-            class B:
-                def method(self):
-                    pass
-            class C:
-                pass
-        """)
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("multi_class.py")
         self.assertEqual(result.classes, 3)
         self.assertEqual(result.functions, 2)
 
-    def test_get_all_analyses_root_level_files(self):
-        """Root-level .py files should be picked up by get_all_analyses."""
-        (Path(self.tmp_dir) / "root_module.py").write_text("x = 1")
-        results = self.analyzer.get_all_analyses()
-        root_files = [k for k in results if "root_module" in k]
-        self.assertEqual(len(root_files), 1)
-
-    def test_get_all_analyses_auto_discovers_subdirs(self):
-        """get_all_analyses should auto-discover subdirs with .py files."""
-        custom = Path(self.tmp_dir) / "mypackage"
-        custom.mkdir()
-        (custom / "core.py").write_text("def main(): pass")
-        (custom / "helpers.py").write_text("def helper(): pass")
-        results = self.analyzer.get_all_analyses()
-        discovered = [k for k in results if "mypackage" in k]
-        self.assertEqual(len(discovered), 2)
-
     def test_high_complexity_issue(self):
         """Files with complexity > COMPLEXITY_THRESHOLD get an issue."""
-        lines = ["def func():"]
-        for i in range(15):
-            lines.append(f"    if x == {i}:")
-            lines.append(f"        return {i}")
-        path = self._write_file("high_complexity.py", "\n".join(lines))
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("high_complexity.py")
         self.assertTrue(any("complexity" in issue.lower() for issue in result.issues))
 
     def test_source_file_not_marked_as_test(self):
         """A source file (not in tests/ and no 'test' in name) should have has_tests=False."""
-        path = self._write_file("module.py", "def func(): pass")
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("module.py")
         self.assertFalse(result.has_tests)
 
     def test_file_in_test_dir_marked_as_test(self):
         """A file in __tests__/ directory should be marked as test."""
-        test_dir = Path(self.tmp_dir) / "__tests__"
-        test_dir.mkdir()
-        path = test_dir / "my_test.py"
-        path.write_text("def test_it(): pass")
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("__tests__/my_test.py")
         self.assertTrue(result.has_tests)
 
     def test_empty_file(self):
-        path = self._write_file("empty.py", "")
-        result = self.analyzer.analyze_file(path)
+        result = self._analyze("empty.py")
         self.assertIsNotNone(result)
         self.assertEqual(result.functions, 0)
         self.assertEqual(result.classes, 0)
         self.assertEqual(result.complexity, 1)  # base complexity
 
 
-class TestGitAnalyzer(unittest.TestCase):
+class TestCodeAnalyzer(unittest.TestCase):
+    """Directory scans; each test builds its own tree under the class root."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
+
+    def setUp(self):
+        # A fresh subdir per test keeps tests isolated; the whole tree is
+        # removed once in tearDownClass.
+        self.tmp_dir = tempfile.mkdtemp(dir=self._root)
+        self.analyzer = CodeAnalyzer(Path(self.tmp_dir))
+
+    def test_analyze_directory(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        (src / "a.py").write_text("def a(): pass")
+        (src / "b.py").write_text("def b(): pass")
+        results = self.analyzer.analyze_directory(src)
+        self.assertEqual(len(results), 2)
+
+    def test_analyze_directory_nonexistent(self):
+        results = self.analyzer.analyze_directory(Path(self.tmp_dir) / "nope")
+        self.assertEqual(len(results), 0)
+
+    def test_get_all_analyses(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        (src / "module.py").write_text("def func(): pass")
+        results = self.analyzer.get_all_analyses()
+        self.assertGreaterEqual(len(results), 1)
+
+    def test_pycache_excluded(self):
+        cache_dir = Path(self.tmp_dir) / "src" / "__pycache__"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "module.cpython-311.py").write_text("x = 1")
+        src = Path(self.tmp_dir) / "src"
+        results = self.analyzer.analyze_directory(src)
+        self.assertEqual(len(results), 0)
+
+    def test_get_all_analyses_root_level_files(self):
+        """Root-level .py files should be picked up by get_all_analyses."""
+        (Path(self.tmp_dir) / "root_module.py").write_text("x = 1")
+        results = self.analyzer.get_all_analyses()
+        root_files = [k for k in results if "root_module" in k]
+        self.assertEqual(len(root_files), 1)
+
+    def test_get_all_analyses_auto_discovers_subdirs(self):
+        """get_all_analyses should auto-discover subdirs with .py files."""
+        custom = Path(self.tmp_dir) / "mypackage"
+        custom.mkdir()
+        (custom / "core.py").write_text("def main(): pass")
+        (custom / "helpers.py").write_text("def helper(): pass")
+        results = self.analyzer.get_all_analyses()
+        discovered = [k for k in results if "mypackage" in k]
+        self.assertEqual(len(discovered), 2)
+
+    def test_analyze_file_result_shared_across_analyzers(self):
+        """An unchanged file is parsed once, even by separate analyzers."""
+        path = Path(self.tmp_dir) / "cached.py"
+        path.write_text("def a(): pass")
+        first = self.analyzer.analyze_file(path)
+        with patch.object(CodeAnalyzer, "_measure_source") as measure:
+            again = CodeAnalyzer(Path(self.tmp_dir)).analyze_file(path)
+        measure.assert_not_called()
+        self.assertEqual(first, again)
+
+    def test_analyze_file_results_are_independent_copies(self):
+        path = Path(self.tmp_dir) / "copied.py"
+        path.write_text("def a(): pass")
+        first = self.analyzer.analyze_file(path)
+        first.issues.append("mutated by a caller")
+        first.lines = -1
+        again = self.analyzer.analyze_file(path)
+        self.assertEqual(again.issues, [])
+        self.assertEqual(again.lines, 1)
+
+    def test_analyze_file_path_relative_to_each_root(self):
+        sub = Path(self.tmp_dir) / "pkg"
+        sub.mkdir()
+        path = sub / "mod.py"
+        path.write_text("x = 1")
+        self.assertEqual(self.analyzer.analyze_file(path).path,
+                         str(Path("pkg") / "mod.py"))
+        self.assertEqual(CodeAnalyzer(sub).analyze_file(path).path, "mod.py")
+
+    def test_analyze_file_picks_up_edits(self):
+        path = Path(self.tmp_dir) / "edited.py"
+        path.write_text("def a(): pass\n")
+        self.assertEqual(self.analyzer.analyze_file(path).functions, 1)
+        path.write_text("def a(): pass\ndef b(): pass\n")
+        self.assertEqual(self.analyzer.analyze_file(path).functions, 2)
+
+    def test_analyze_file_picks_up_same_size_edit_with_same_mtime(self):
+        path = Path(self.tmp_dir) / "rewritten.py"
+        path.write_text("def a(): pass\n")
+        before = path.stat()
+        self.assertEqual(self.analyzer.analyze_file(path).functions, 1)
+        path.write_text("class A: pass\n")
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        self.assertEqual(path.stat().st_size, before.st_size)
+        analysis = self.analyzer.analyze_file(path)
+        self.assertEqual((analysis.functions, analysis.classes), (0, 1))
+
+
+@unittest.skipIf(_SKIP_SLOW, "slow: forks real git processes")
+class TestGitAnalyzerIntegration(unittest.TestCase):
     """Tests for GitAnalyzer using the actual project repo (read-only)."""
 
     def test_get_current_hash_real_repo(self):
@@ -258,44 +328,44 @@ class TestGitAnalyzer(unittest.TestCase):
             branch = analyzer.get_branch()
             self.assertIn(branch, ["", "unknown"])
 
-    @patch("analyzers.subprocess.run")
-    def test_get_current_hash_mock(self, mock_run):
-        mock_run.return_value = MagicMock(stdout="abcdef1234567890\n")
-        analyzer = GitAnalyzer(Path("/fake"))
-        h = analyzer.get_current_hash()
+
+class TestGitAnalyzer(unittest.TestCase):
+    """GitAnalyzer parsing against a mocked subprocess.run."""
+
+    def setUp(self):
+        patcher = patch("analyzers.subprocess.run")
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.analyzer = GitAnalyzer(Path("/fake"))
+
+    def test_get_current_hash_mock(self):
+        self.mock_run.return_value = MagicMock(stdout="abcdef1234567890\n")
+        h = self.analyzer.get_current_hash()
         self.assertEqual(h, "abcdef12")
 
-    @patch("analyzers.subprocess.run")
-    def test_get_recent_commits_mock(self, mock_run):
-        mock_run.return_value = MagicMock(
+    def test_get_recent_commits_mock(self):
+        self.mock_run.return_value = MagicMock(
             stdout="abc12345|fix bug|2026-01-01\ndef67890|add feature|2026-01-02"
         )
-        analyzer = GitAnalyzer(Path("/fake"))
-        commits = analyzer.get_recent_commits(2)
+        commits = self.analyzer.get_recent_commits(2)
         self.assertEqual(len(commits), 2)
         self.assertEqual(commits[0]["message"], "fix bug")
 
-    @patch("analyzers.subprocess.run")
-    def test_get_uncommitted_mock(self, mock_run):
-        mock_run.return_value = MagicMock(stdout=" M file.py\n?? new.py\n")
-        analyzer = GitAnalyzer(Path("/fake"))
-        changes = analyzer.get_uncommitted_changes()
+    def test_get_uncommitted_mock(self):
+        self.mock_run.return_value = MagicMock(stdout=" M file.py\n?? new.py\n")
+        changes = self.analyzer.get_uncommitted_changes()
         self.assertEqual(len(changes), 2)
 
-    @patch("analyzers.subprocess.run")
-    def test_get_branch_mock(self, mock_run):
-        mock_run.return_value = MagicMock(stdout="feature/test\n")
-        analyzer = GitAnalyzer(Path("/fake"))
-        self.assertEqual(analyzer.get_branch(), "feature/test")
-
-    @patch("analyzers.subprocess.run")
-    def test_exception_handling(self, mock_run):
-        mock_run.side_effect = Exception("git not found")
-        analyzer = GitAnalyzer(Path("/fake"))
-        self.assertEqual(analyzer.get_current_hash(), "")
-        self.assertEqual(analyzer.get_recent_commits(), [])
-        self.assertEqual(analyzer.get_uncommitted_changes(), [])
-        self.assertEqual(analyzer.get_branch(), "unknown")
+    def test_get_branch_mock(self):
+        self.mock_run.return_value = MagicMock(stdout="feature/test\n")
+        self.assertEqual(self.analyzer.get_branch(), "feature/test")
+
+    def test_exception_handling(self):
+        self.mock_run.side_effect = Exception("git not found")
+        self.assertEqual(self.analyzer.get_current_hash(), "")
+        self.assertEqual(self.analyzer.get_recent_commits(), [])
+        self.assertEqual(self.analyzer.get_uncommitted_changes(), [])
+        self.assertEqual(self.analyzer.get_branch(), "unknown")
 
 
 if __name__ == "__main__":
@@ -1,42 +1,42 @@
 """Tests for AnalyticsPerspective and DebugPerspective from diagnostics.py."""
 
-import shutil
+import os
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from models import OrganismState, Perspective, Priority
-from analyzers import GitAnalyzer
 from diagnostics import AnalyticsPerspective, DebugPerspective
+from tests._helpers import _FLAT_HISTORY, _TEST_ROOT, _StubGit
 
 
-def _mock_git_analyzer(**overrides):
-    """Create a mock GitAnalyzer with sensible defaults."""
-    mock = MagicMock(spec=GitAnalyzer)
-    mock.get_current_hash.return_value = "abc12345"
-    mock.get_recent_commits.return_value = overrides.get("commits", [])
-    mock.get_uncommitted_changes.return_value = overrides.get("uncommitted", [])
-    mock.get_branch.return_value = "main"
-    return mock
+# These tests run against an empty history and a clean tree unless they
+# ask for more, unlike the shared default stub's single commit.
+_NO_COMMITS_GIT = _StubGit(commits=[])
+
+
+def _mock_git_analyzer(commits=None, uncommitted=None):
+    """Return a GitAnalyzer stub with no commits unless told otherwise."""
+    if commits is None and uncommitted is None:
+        return _NO_COMMITS_GIT
+    return _StubGit(commits=[] if commits is None else commits,
+                    uncommitted=uncommitted)
 
 
 class TestAnalyticsPerspective(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
         self.state = OrganismState()
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def _make_analyzer(self, state=None, commits=None):
         s = state or self.state
-        analyzer = AnalyticsPerspective(Path(self.tmp_dir), s)
-        analyzer.git_analyzer = _mock_git_analyzer(commits=commits or [])
+        # AnalyticsPerspective reads only state and git, never the tree,
+        # so no per-test directory is needed.
+        analyzer = AnalyticsPerspective(Path(_TEST_ROOT), s)
+        analyzer.git_analyzer = _mock_git_analyzer(commits=commits)
         return analyzer
 
     def test_get_perspective(self):
@@ -121,9 +121,7 @@ class TestAnalyticsPerspective(unittest.TestCase):
         self.assertEqual(len(trend_prompts), 0)
 
     def test_high_fix_rate_detected(self):
-        self.state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
+        self.state.fitness_history = list(_FLAT_HISTORY)
         commits = [
             {"hash": f"fix{i}", "message": f"fix: issue {i}", "date": "2026-01-01"}
             for i in range(7)
@@ -137,9 +135,7 @@ class TestAnalyticsPerspective(unittest.TestCase):
         self.assertEqual(fix_prompts[0].priority, Priority.MEDIUM)
 
     def test_low_fix_rate_no_prompt(self):
-        self.state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
+        self.state.fitness_history = list(_FLAT_HISTORY)
         commits = [
             {"hash": f"feat{i}", "message": f"add feature {i}", "date": "2026-01-01"}
             for i in range(8)
@@ -152,9 +148,7 @@ class TestAnalyticsPerspective(unittest.TestCase):
         self.assertEqual(len(fix_prompts), 0)
 
     def test_no_commits_no_fix_rate_prompt(self):
-        self.state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
+        self.state.fitness_history = list(_FLAT_HISTORY)
         analyzer = self._make_analyzer(commits=[])
         metrics, prompts = analyzer.analyze()
         fix_prompts = [p for p in prompts if "fix rate" in p.title.lower()]
@@ -162,9 +156,7 @@ class TestAnalyticsPerspective(unittest.TestCase):
 
     def test_fitness_is_1_0_with_no_issues(self):
         """Analytics fitness is 1.0 when history is sufficient and no issues."""
-        self.state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
+        self.state.fitness_history = list(_FLAT_HISTORY)
         analyzer = self._make_analyzer()
         metrics, _ = analyzer.analyze()
         self.assertEqual(metrics["error_rate_trends"], 1.0)
@@ -181,9 +173,7 @@ class TestAnalyticsPerspective(unittest.TestCase):
 
     def test_fitness_reduced_by_high_fix_rate(self):
         """High fix rate (MEDIUM priority) reduces fitness by 0.15."""
-        self.state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
+        self.state.fitness_history = list(_FLAT_HISTORY)
         commits = [
             {"hash": f"fix{i}", "message": f"fix: issue {i}", "date": "2026-01-01"}
             for i in range(7)
@@ -233,15 +223,12 @@ class TestAnalyticsPerspective(unittest.TestCase):
 class TestDebugPerspective(unittest.TestCase):
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.tmp_dir = tempfile.mkdtemp(dir=_TEST_ROOT)
         self.state = OrganismState()
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
     def _make_analyzer(self, uncommitted=None):
         analyzer = DebugPerspective(Path(self.tmp_dir), self.state)
-        analyzer.git_analyzer = _mock_git_analyzer(uncommitted=uncommitted or [])
+        analyzer.git_analyzer = _mock_git_analyzer(uncommitted=uncommitted)
         return analyzer
 
     def test_get_perspective(self):
@@ -352,6 +339,82 @@ class TestDebugPerspective(unittest.TestCase):
         self.assertIn("handler.py", todo_prompts[0].file_path)
         self.assertEqual(todo_prompts[0].line_number, 1)
 
+    def test_todo_line_numbers_after_first_line(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        (src / "module.py").write_text(
+            "import os\n\nx = 1  # TODO\ny = 2\n# FIXME: later\n")
+        analyzer = self._make_analyzer()
+        todos = analyzer._find_todo_comments()
+        self.assertEqual([(t["line"], t["type"], t["text"]) for t in todos],
+                         [(3, "TODO", ""), (5, "FIXME", "later")])
+
+    def test_binary_file_skipped_in_todo_scan(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        (src / "blob.py").write_bytes(b"\0\0# TODO: not a real comment\n")
+        analyzer = self._make_analyzer()
+        self.assertEqual(analyzer._find_todo_comments(), [])
+
+    def test_todo_scan_picks_up_edits(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        path = src / "module.py"
+        path.write_text("# TODO: first\n")
+        analyzer = self._make_analyzer()
+        self.assertEqual(len(analyzer._find_todo_comments()), 1)
+        path.write_text("# TODO: first\n# FIXME: second\n")
+        self.assertEqual(len(analyzer._find_todo_comments()), 2)
+
+    def test_todo_scan_picks_up_same_size_edit_with_same_mtime(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        path = src / "module.py"
+        path.write_text("# TODO: aaa\n")
+        before = path.stat()
+        analyzer = self._make_analyzer()
+        self.assertEqual(len(analyzer._find_todo_comments()), 1)
+        path.write_text("x = 1  # ok\n")
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        self.assertEqual(path.stat().st_size, before.st_size)
+        self.assertEqual(analyzer._find_todo_comments(), [])
+
+    def test_todo_scan_cache_is_per_root(self):
+        stamp = 1_700_000_000_000_000_000
+        expected = {}
+        for name in ("a", "b"):
+            path = Path(self.tmp_dir) / name / "src" / "m.py"
+            path.parent.mkdir(parents=True)
+            # Same relative path, size and mtime under both roots.
+            path.write_text(f"# TODO: {name * 3}\n")
+            os.utime(path, ns=(stamp, stamp))
+            expected[name] = [name * 3]
+        for name, texts in expected.items():
+            analyzer = DebugPerspective(Path(self.tmp_dir) / name, self.state)
+            analyzer.git_analyzer = _mock_git_analyzer()
+            todos = analyzer._find_todo_comments()
+            self.assertEqual([t["text"] for t in todos], texts)
+
+    def test_todo_scan_results_are_independent_copies(self):
+        src = Path(self.tmp_dir) / "src"
+        src.mkdir()
+        (src / "module.py").write_text("# TODO: first\n")
+        analyzer = self._make_analyzer()
+        analyzer._find_todo_comments()[0]["text"] = "mutated"
+        todos = analyzer._find_todo_comments()
+        self.assertEqual([t["text"] for t in todos], ["first"])
+
+    def test_root_under_tests_dir_still_scanned(self):
+        root = Path(self.tmp_dir) / "tests" / "project"
+        (root / "src").mkdir(parents=True)
+        (root / "src" / "module.py").write_text("# TODO: inside project\n")
+        (root / "tests").mkdir()
+        (root / "tests" / "helper.py").write_text("# TODO: fixture\n")
+        analyzer = DebugPerspective(root, OrganismState())
+        analyzer.git_analyzer = _mock_git_analyzer()
+        todos = analyzer._find_todo_comments()
+        self.assertEqual([t["text"] for t in todos], ["inside project"])
+
     def test_todo_with_colon_separator(self):
         src = Path(self.tmp_dir) / "src"
         src.mkdir()
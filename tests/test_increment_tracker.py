@@ -11,12 +11,11 @@ import tempfile
 import textwrap
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from increment_tracker import IncrementTracker
-from analyzers import GitAnalyzer
 
 
 # -------------------------------------------------------------------
@@ -101,6 +100,7 @@ class _TrackerTestCase(unittest.TestCase):
 
     def setUp(self):
         self.tmp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
         self.req_dir = self.tmp_dir / "todo"
         self.req_dir.mkdir()
         self.prin_dir = self.tmp_dir / "how"
@@ -109,9 +109,6 @@ class _TrackerTestCase(unittest.TestCase):
         _make_principle(self.prin_dir, "P2")
         self.tracker = IncrementTracker(self.tmp_dir)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
 
 # -------------------------------------------------------------------
 # Discovery
@@ -1,30 +1,48 @@
 """Tests for SelfDevelopmentOrganism orchestrator and CLI entry point."""
 
+import io
+import json
+import os
+import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Resolved once and shared by the import path and the CLI smoke test.
+# The insert is still needed for the unittest fallback in
+# organism._run_tests, which runs from the project root without a conftest.
+_SELFDEV_DIR = Path(__file__).resolve().parent.parent
+if str(_SELFDEV_DIR) not in sys.path:
+    sys.path.insert(0, str(_SELFDEV_DIR))
+
+_ORGANISM_SCRIPT = str(_SELFDEV_DIR / "organism.py")
+
+# Set SELFDEV_SKIP_SLOW=1 to leave out tests that spawn interpreters or
+# touch a real repository; works the same under pytest and unittest.
+_SKIP_SLOW = bool(os.environ.get("SELFDEV_SKIP_SLOW"))
 
 from models import OrganismState, Perspective
-from analyzers import GitAnalyzer
-from organism import SelfDevelopmentOrganism
+from organism import SelfDevelopmentOrganism, main
+from tests._helpers import _StubGit
+
+
+# The stub is stateless, so every test can share one instance.
+_SHARED_GIT_MOCK = _StubGit(changed_files=["selfdev/organism.py"])
 
 
-def _mock_git_analyzer():
-    """Create a mock GitAnalyzer that doesn't require a real git repo."""
-    mock = MagicMock(spec=GitAnalyzer)
-    mock.get_current_hash.return_value = "abc12345"
-    mock.get_recent_commits.return_value = [
-        {"hash": "abc12345", "message": "Initial commit", "date": "2026-01-01"}
-    ]
-    mock.get_uncommitted_changes.return_value = []
-    mock.get_branch.return_value = "main"
-    mock.get_changed_files_in_last_commit.return_value = ["selfdev/organism.py"]
-    return mock
+def _run_cli(*args):
+    """Run organism.main() in-process; return (exit_code, stdout)."""
+    buf = io.StringIO()
+    with patch("sys.argv", ["organism.py", *args]), redirect_stdout(buf):
+        try:
+            code = main() or 0
+        except SystemExit as exc:
+            code = exc.code or 0
+    return code, buf.getvalue()
 
 
 def _patch_tests_pass():
@@ -33,50 +51,140 @@ def _patch_tests_pass():
                         return_value=(True, "all passed"))
 
 
-class TestSelfDevelopmentOrganism(unittest.TestCase):
+class TestSharedOrganism(unittest.TestCase):
+    """Tests that share one organism built on an empty root.
+
+    State is reset before each test and the perspective registry is
+    restored after it; tests that need files on disk build their own.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        with patch("perspectives.GitAnalyzer", return_value=_SHARED_GIT_MOCK):
+            cls.organism = SelfDevelopmentOrganism(root_dir=Path(cls.tmp_dir))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir)
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
+        self.organism.reset_state()
+        self.addCleanup(self._restore_perspectives,
+                        dict(self.organism.perspectives))
 
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmp_dir)
+    def _restore_perspectives(self, saved):
+        """Undo any register/unregister a test made on the shared organism."""
+        self.organism.perspectives.clear()
+        self.organism.perspectives.update(saved)
 
     def test_organism_initialization(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        self.assertEqual(len(organism.perspectives), 5)
+        self.assertEqual(len(self.organism.perspectives), 5)
+
+    def test_perspectives_sorted_by_priority(self):
+        prompts = self.organism.run_perspective(Perspective.USER)
+        if len(prompts) > 1:
+            for i in range(len(prompts) - 1):
+                self.assertLessEqual(prompts[i].priority.value, prompts[i + 1].priority.value)
+
+    def test_run_perspective_returns_sorted_prompts(self):
+        """run_perspective should return prompts sorted by priority."""
+        prompts = self.organism.run_perspective(Perspective.USER)
+        if len(prompts) > 1:
+            for i in range(len(prompts) - 1):
+                self.assertLessEqual(prompts[i].priority.value, prompts[i + 1].priority.value)
+
+    def test_all_five_perspectives_registered(self):
+        expected = {Perspective.USER, Perspective.TEST, Perspective.SYSTEM,
+                    Perspective.ANALYTICS, Perspective.DEBUG}
+        self.assertEqual(set(self.organism.perspectives.keys()), expected)
 
     def test_run_single_perspective(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        prompts = organism.run_perspective(Perspective.USER)
+        prompts = self.organism.run_perspective(Perspective.USER)
         self.assertIsInstance(prompts, list)
 
+    def test_print_state(self):
+        self.organism.state.fitness_scores = {"user": 0.7}
+        self.organism.print_state()
+
+    def test_run_perspective_stores_fitness_score(self):
+        self.organism.run_perspective(Perspective.DEBUG)
+        self.assertIn("debug", self.organism.state.fitness_scores)
+        self.assertIsInstance(self.organism.state.fitness_scores["debug"], float)
+
+    def test_run_perspective_no_prompts(self):
+        """Debug perspective on empty dir should print 'No issues found'."""
+        prompts = self.organism.run_perspective(Perspective.DEBUG)
+        self.assertEqual(len(prompts), 0)
+
+    def test_print_state_no_fitness(self):
+        """Print state when no fitness scores exist."""
+        self.organism.print_state()
+
     def test_run_all_perspectives(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
-        all_prompts = organism.run_all_perspectives()
+        all_prompts = self.organism.run_all_perspectives()
         self.assertIsInstance(all_prompts, list)
-        self.assertIn("user", organism.state.fitness_scores)
-        self.assertIn("test", organism.state.fitness_scores)
+        self.assertIn("user", self.organism.state.fitness_scores)
+        self.assertIn("test", self.organism.state.fitness_scores)
+
+    def test_register_perspective_replaces(self):
+        """register_perspective should swap in a new analyzer."""
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze.return_value = ({}, [])
+        mock_analyzer.compute_fitness.return_value = 0.99
+        self.organism.register_perspective(Perspective.USER, mock_analyzer)
+        self.assertIs(self.organism.perspectives[Perspective.USER], mock_analyzer)
+
+    def test_unregister_perspective(self):
+        """unregister_perspective should remove a perspective."""
+        self.organism.unregister_perspective(Perspective.DEBUG)
+        self.assertNotIn(Perspective.DEBUG, self.organism.perspectives)
+
+    def test_reset_state_rebinds_perspectives(self):
+        """reset_state should hand the new state to every perspective."""
+        state = OrganismState(generation=7)
+        self.organism.reset_state(state)
+        self.assertIs(self.organism.state, state)
+        for analyzer in self.organism.perspectives.values():
+            self.assertIs(analyzer.state, state)
+
+
+class TestSelfDevelopmentOrganism(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root)
+
+    def setUp(self):
+        # Every organism built in these tests gets the stub from its
+        # perspectives and from advance_generation, without real git calls.
+        for target in ("perspectives.GitAnalyzer", "organism.GitAnalyzer"):
+            patcher = patch(target, return_value=_SHARED_GIT_MOCK)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _make_tmp(self) -> Path:
+        """Create a fresh root under the class root; removed in tearDownClass."""
+        return Path(tempfile.mkdtemp(dir=self._root))
 
     def test_advance_generation(self):
+        tmp_dir = self._make_tmp()
         # Create increment files for the tracker to find
-        req_dir = Path(self.tmp_dir) / "todo"
+        req_dir = tmp_dir / "todo"
         req_dir.mkdir()
         (req_dir / "increment_0001_todo_test.md").write_text(
             "# Increment 0001: Test\n\n**Requirement ID:** R1\n**Status:** TODO\n\n"
             "## Description\nTest increment.\n\n## Acceptance Criteria\n- [ ] Done\n"
         )
-        prin_dir = Path(self.tmp_dir) / "how"
+        prin_dir = tmp_dir / "how"
         prin_dir.mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state()
         organism.state.fitness_scores = {"user": 0.5, "test": 0.3}
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
         initial_gen = organism.state.generation
         with _patch_tests_pass():
             organism.advance_generation()
@@ -86,66 +194,32 @@ class TestSelfDevelopmentOrganism(unittest.TestCase):
         self.assertTrue((req_dir / "increment_0001_done_test.md").exists())
         self.assertFalse((req_dir / "increment_0001_todo_test.md").exists())
 
-    def test_print_state(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state.fitness_scores = {"user": 0.7}
-        organism.print_state()
-
-    def test_perspectives_sorted_by_priority(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        prompts = organism.run_perspective(Perspective.USER)
-        if len(prompts) > 1:
-            for i in range(len(prompts) - 1):
-                self.assertLessEqual(prompts[i].priority.value, prompts[i + 1].priority.value)
-
-
-    def test_run_perspective_stores_fitness_score(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
-        organism.run_perspective(Perspective.DEBUG)
-        self.assertIn("debug", organism.state.fitness_scores)
-        self.assertIsInstance(organism.state.fitness_scores["debug"], float)
-
-    def test_run_perspective_no_prompts(self):
-        """Debug perspective on empty dir should print 'No issues found'."""
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
-        prompts = organism.run_perspective(Perspective.DEBUG)
-        self.assertEqual(len(prompts), 0)
-
-    @patch("organism.GitAnalyzer")
-    def test_advance_generation_records_git_hash(self, mock_git_cls):
-        mock_git_cls.return_value = _mock_git_analyzer()
-        req_dir = Path(self.tmp_dir) / "todo"
+    def test_advance_generation_records_git_hash(self):
+        tmp_dir = self._make_tmp()
+        req_dir = tmp_dir / "todo"
         req_dir.mkdir()
         (req_dir / "increment_0001_todo_test.md").write_text(
             "# Increment 0001: Test\n\n**Requirement ID:** R1\n**Status:** TODO\n\n"
             "## Description\nTest.\n\n## Acceptance Criteria\n- [ ] Done\n"
         )
-        (Path(self.tmp_dir) / "how").mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
+        (tmp_dir / "how").mkdir()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state()
         with _patch_tests_pass():
             organism.advance_generation()
         self.assertEqual(organism.state.last_git_hash, "abc12345")
 
     def test_advance_generation_updates_stage(self):
-        req_dir = Path(self.tmp_dir) / "todo"
+        tmp_dir = self._make_tmp()
+        req_dir = tmp_dir / "todo"
         req_dir.mkdir()
         (req_dir / "increment_0001_todo_test.md").write_text(
             "# Increment 0001: Test\n\n**Requirement ID:** R1\n**Status:** TODO\n\n"
             "## Description\nTest.\n\n## Acceptance Criteria\n- [ ] Done\n"
         )
-        (Path(self.tmp_dir) / "how").mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState(generation=3)
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
+        (tmp_dir / "how").mkdir()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state(OrganismState(generation=3))
         with _patch_tests_pass():
             organism.advance_generation()
         # Generation 4 = growth stage
@@ -153,19 +227,17 @@ class TestSelfDevelopmentOrganism(unittest.TestCase):
 
     def test_advance_generation_stores_overall_key(self):
         """advance_generation should store an 'overall' key in fitness_history."""
-        req_dir = Path(self.tmp_dir) / "todo"
+        tmp_dir = self._make_tmp()
+        req_dir = tmp_dir / "todo"
         req_dir.mkdir()
         (req_dir / "increment_0001_todo_test.md").write_text(
             "# Increment 0001: Test\n\n**Requirement ID:** R1\n**Status:** TODO\n\n"
             "## Description\nTest.\n\n## Acceptance Criteria\n- [ ] Done\n"
         )
-        (Path(self.tmp_dir) / "how").mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
+        (tmp_dir / "how").mkdir()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state()
         organism.state.fitness_scores = {"user": 0.8, "test": 0.6}
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
         with _patch_tests_pass():
             organism.advance_generation()
         entry = organism.state.fitness_history[-1]
@@ -174,83 +246,48 @@ class TestSelfDevelopmentOrganism(unittest.TestCase):
 
     def test_advance_generation_with_no_increments(self):
         """advance_generation with no increment files prints completion message."""
-        (Path(self.tmp_dir) / "todo").mkdir()
-        (Path(self.tmp_dir) / "how").mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
-        mock_git = _mock_git_analyzer()
-        for p in organism.perspectives.values():
-            p.git_analyzer = mock_git
+        tmp_dir = self._make_tmp()
+        (tmp_dir / "todo").mkdir()
+        (tmp_dir / "how").mkdir()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state()
         # Should not raise, just print "all done"
         organism.advance_generation()
 
-    def test_run_perspective_returns_sorted_prompts(self):
-        """run_perspective should return prompts sorted by priority."""
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        prompts = organism.run_perspective(Perspective.USER)
-        if len(prompts) > 1:
-            for i in range(len(prompts) - 1):
-                self.assertLessEqual(prompts[i].priority.value, prompts[i + 1].priority.value)
-
-    def test_print_state_no_fitness(self):
-        """Print state when no fitness scores exist."""
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
-        organism.print_state()
-
-    def test_all_five_perspectives_registered(self):
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        expected = {Perspective.USER, Perspective.TEST, Perspective.SYSTEM,
-                    Perspective.ANALYTICS, Perspective.DEBUG}
-        self.assertEqual(set(organism.perspectives.keys()), expected)
-
-    def test_register_perspective_replaces(self):
-        """register_perspective should swap in a new analyzer."""
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        mock_analyzer = MagicMock()
-        mock_analyzer.analyze.return_value = ({}, [])
-        mock_analyzer.compute_fitness.return_value = 0.99
-        organism.register_perspective(Perspective.USER, mock_analyzer)
-        self.assertIs(organism.perspectives[Perspective.USER], mock_analyzer)
-
-    def test_unregister_perspective(self):
-        """unregister_perspective should remove a perspective."""
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.unregister_perspective(Perspective.DEBUG)
-        self.assertNotIn(Perspective.DEBUG, organism.perspectives)
-
     def test_custom_fitness_fn(self):
         """A custom fitness_fn passed to a perspective should be used."""
         from perspectives import TestPerspective
         custom_fn = lambda metrics, prompts: 0.42
+        # compute_fitness never touches the filesystem, so no tmpdir needed
         analyzer = TestPerspective(
-            Path(self.tmp_dir), OrganismState(), fitness_fn=custom_fn)
+            Path("/nonexistent"), OrganismState(), fitness_fn=custom_fn)
         metrics = {"code_coverage": 1.0, "test_pass_rate": 1.0}
         self.assertAlmostEqual(analyzer.compute_fitness(metrics, []), 0.42)
 
     def test_config_loaded_from_file(self):
         """Organism should load thresholds from selfdev_config.json."""
-        import json
-        config_path = Path(self.tmp_dir) / "selfdev_config.json"
+        tmp_dir = self._make_tmp()
+        config_path = tmp_dir / "selfdev_config.json"
         config_path.write_text(json.dumps({
             "complexity_threshold": 20,
             "max_file_lines": 500,
         }))
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
         self.assertEqual(organism.config["complexity_threshold"], 20)
         self.assertEqual(organism.config["max_file_lines"], 500)
 
     def test_advance_blocked_when_tests_fail(self):
         """advance_generation must not advance when tests fail."""
-        req_dir = Path(self.tmp_dir) / "todo"
+        tmp_dir = self._make_tmp()
+        req_dir = tmp_dir / "todo"
         req_dir.mkdir()
         (req_dir / "increment_0001_todo_test.md").write_text(
             "# Increment 0001: Test\n\n**Requirement ID:** R1\n**Status:** TODO\n\n"
             "## Description\nTest.\n\n## Acceptance Criteria\n- [ ] Done\n"
         )
-        (Path(self.tmp_dir) / "how").mkdir()
-        organism = SelfDevelopmentOrganism(root_dir=Path(self.tmp_dir))
-        organism.state = OrganismState()
+        (tmp_dir / "how").mkdir()
+        organism = SelfDevelopmentOrganism(root_dir=tmp_dir)
+        organism.reset_state()
         with patch.object(SelfDevelopmentOrganism, "_run_tests",
                           return_value=(False, "FAILED test_foo")):
             organism.advance_generation()
@@ -259,9 +296,10 @@ class TestSelfDevelopmentOrganism(unittest.TestCase):
         # File should still be todo
         self.assertTrue((req_dir / "increment_0001_todo_test.md").exists())
 
+    @unittest.skipIf(_SKIP_SLOW, "slow: spawns a pytest subprocess")
     def test_run_tests_ignores_empty_selfdev_tests_cache_dir(self):
         """A cache-only selfdev/tests directory must not shadow root tests/."""
-        root = Path(self.tmp_dir)
+        root = self._make_tmp()
         cache_dir = root / "selfdev" / "tests" / "__pycache__"
         cache_dir.mkdir(parents=True)
         (cache_dir / "test_smoke.cpython-313.pyc").write_bytes(b"cache")
@@ -281,79 +319,75 @@ class TestSelfDevelopmentOrganism(unittest.TestCase):
 
 
 class TestCLI(unittest.TestCase):
+    """CLI tests call organism.main() in-process instead of spawning Python."""
+
+    @classmethod
+    def setUpClass(cls):
+        # --root with --state/--all never writes, so one empty root suffices
+        cls._empty_root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._empty_root, ignore_errors=True)
 
     def test_self_flag(self):
-        result = subprocess.run(
-            [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-             "--self", "--state"],
-            capture_output=True, text=True,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("ORGANISM STATE", result.stdout)
+        code, out = _run_cli("--self", "--state")
+        self.assertEqual(code, 0)
+        self.assertIn("ORGANISM STATE", out)
 
     def test_help_flag(self):
-        result = subprocess.run(
-            [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-             "--help"],
-            capture_output=True, text=True,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("Self-Development System", result.stdout)
+        with self.assertRaises(SystemExit) as ctx:
+            with patch("sys.argv", ["organism.py", "--help"]), \
+                    redirect_stdout(io.StringIO()) as buf:
+                main()
+        self.assertEqual(ctx.exception.code, 0)
+        self.assertIn("Self-Development System", buf.getvalue())
 
     def test_root_flag(self):
-        with tempfile.TemporaryDirectory() as d:
-            result = subprocess.run(
-                [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-                 "--root", d, "--state"],
-                capture_output=True, text=True,
-            )
-            self.assertEqual(result.returncode, 0)
+        code, _ = _run_cli("--root", self._empty_root, "--state")
+        self.assertEqual(code, 0)
 
     def test_self_analysis_runs(self):
-        result = subprocess.run(
-            [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-             "--self", "--user"],
-            capture_output=True, text=True,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("USER", result.stdout)
+        code, out = _run_cli("--self", "--user")
+        self.assertEqual(code, 0)
+        self.assertIn("USER", out)
 
 
     def test_multiple_perspectives_cli(self):
         """Running with two perspective flags shows both."""
-        result = subprocess.run(
-            [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-             "--self", "--user", "--test"],
-            capture_output=True, text=True,
-        )
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("USER", result.stdout)
-        self.assertIn("TEST", result.stdout)
-        self.assertIn("SUMMARY", result.stdout)
+        code, out = _run_cli("--self", "--user", "--test")
+        self.assertEqual(code, 0)
+        self.assertIn("USER", out)
+        self.assertIn("TEST", out)
+        self.assertIn("SUMMARY", out)
 
     def test_single_perspective_no_summary(self):
         """Running with one perspective flag should not show summary."""
+        code, out = _run_cli("--self", "--debug")
+        self.assertEqual(code, 0)
+        self.assertIn("DEBUG", out)
+        self.assertNotIn("SUMMARY", out)
+
+    def test_all_flag_shows_all_perspectives(self):
+        """--all flag should show all 6 perspectives."""
+        code, out = _run_cli("--root", self._empty_root, "--all")
+        self.assertEqual(code, 0)
+        # Tokenize once instead of rescanning the whole output per name
+        expected = {"USER", "TEST", "SYSTEM", "ANALYTICS", "DEBUG", "SUMMARY"}
+        self.assertLessEqual(expected, set(out.split()))
+
+    @unittest.skipIf(_SKIP_SLOW, "slow: spawns a Python interpreter")
+    def test_script_entry_point(self):
+        """One real subprocess smoke test keeps the __main__ wiring covered."""
         result = subprocess.run(
-            [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-             "--self", "--debug"],
+            # -E -S skip PYTHON* env vars and site.py, -B skips .pyc writes;
+            # -I would also drop the script directory from sys.path and
+            # break organism's imports.
+            [sys.executable, "-B", "-E", "-S", _ORGANISM_SCRIPT, "--help"],
             capture_output=True, text=True,
         )
         self.assertEqual(result.returncode, 0)
-        self.assertIn("DEBUG", result.stdout)
-        self.assertNotIn("SUMMARY", result.stdout)
-
-    def test_all_flag_shows_all_perspectives(self):
-        """--all flag should show all 6 perspectives."""
-        with tempfile.TemporaryDirectory() as d:
-            result = subprocess.run(
-                [sys.executable, str(Path(__file__).resolve().parent.parent / "organism.py"),
-                 "--root", d, "--all"],
-                capture_output=True, text=True,
-            )
-            self.assertEqual(result.returncode, 0)
-            for name in ["USER", "TEST", "SYSTEM", "ANALYTICS", "DEBUG"]:
-                self.assertIn(name, result.stdout)
-            self.assertIn("SUMMARY", result.stdout)
+        self.assertIn("Self-Development System", result.stdout)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,6 @@ Acceptance criteria:
 import sys
 import os
 import time
-import tempfile
 import unittest
 from pathlib import Path
 
@@ -26,7 +25,9 @@ from performance import (
     ANALYSIS_TIMEOUT_SECONDS,
     MEMORY_LIMIT_MB,
 )
-from models import OrganismState
+
+# SELFDEV_SKIP_SLOW=1 leaves out the full-analysis runs below.
+_SKIP_SLOW = bool(os.environ.get("SELFDEV_SKIP_SLOW"))
 
 
 class TestTimedOperation(unittest.TestCase):
@@ -108,6 +109,7 @@ class TestNoExternalApis(unittest.TestCase):
             )
 
 
+@unittest.skipIf(_SKIP_SLOW, "slow: runs full analyses of selfdev itself")
 class TestFullAnalysisPerformance(unittest.TestCase):
     """Integration test: full analysis within 30-second budget."""
 
@@ -1,39 +1,83 @@
 """Tests for all perspective analyzers."""
 import json
-import shutil
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from models import OrganismState, Perspective, Priority
-from analyzers import GitAnalyzer
+from models import OrganismState, Priority
 from perspectives import TestPerspective, SystemPerspective
 from user_perspective import UserPerspective
 from diagnostics import AnalyticsPerspective, DebugPerspective
+from tests._helpers import (
+    _FLAT_HISTORY, _TEST_ROOT, _StubGit, _mock_git_analyzer)
 
 
-def _mock_git_analyzer():
-    mock = MagicMock(spec=GitAnalyzer)
-    mock.get_current_hash.return_value = "abc12345"
-    mock.get_recent_commits.return_value = [
-        {"hash": "abc12345", "message": "Initial commit", "date": "2026-01-01"}
-    ]
-    mock.get_uncommitted_changes.return_value = []
-    mock.get_branch.return_value = "main"
-    return mock
+def _has_priority(prompts, priority):
+    return any(p.priority == priority for p in prompts)
 
 
-class TestUserPerspective(unittest.TestCase):
+# Long enough to clear UserPerspective's README length checks.
+_LONG_README = ("# Project\n" + "x" * 5000).encode("ascii")
+_PACKAGE_JSON = json.dumps(
+    {"name": "test", "description": "A test project"}).encode("ascii")
+_PACKAGE_JSON_NO_DESCRIPTION = json.dumps({"name": "test"}).encode("ascii")
+
+# Static source payloads, built once per process instead of per test.
+_SMALL_MODULES = {
+    f"src/module_{i}.py": f"def func_{i}(): pass" for i in range(5)}
+_LONG_MODULE = "\n".join(["x = 1"] * 6)
+_COMPLEX_MODULE = "\n".join(["def func():"] + [
+    f"    if x == {i}:\n        return {i}" for i in range(15)])
+_TODO_BLOB = "\n".join(f"# TODO: item {i}" for i in range(15))
+
+# AnalyticsPerspective only reads fitness_history, so tests can share the
+# entry dicts; each test still gets its own list.
+_DECLINING_HISTORY = tuple(
+    {"overall": 0.8, "generation": i} for i in range(6)
+) + tuple({"overall": 0.4, "generation": i} for i in range(6, 11))
+_IMPROVING_HISTORY = tuple(
+    {"overall": 0.3, "generation": i} for i in range(6)
+) + tuple({"overall": 0.8, "generation": i} for i in range(6, 11))
+
+
+def _materialize(root, files):
+    """Write {relative path: str or bytes} under root, creating each dir once."""
+    root = Path(root)
+    made = set()
+    for rel, content in files.items():
+        path = root / rel
+        if path.parent not in made:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            made.add(path.parent)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+
+
+# Perspective analyzers only read state, so tests that never touch it
+# share one instance; tests that set fitness_history build their own.
+_READONLY_STATE = OrganismState()
+
+
+class _TmpRootTestCase(unittest.TestCase):
+    """Base class: a fresh subdir of _TEST_ROOT per test, shared read-only state."""
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-        self.state = OrganismState()
+        self.tmp_dir = tempfile.mkdtemp(dir=_TEST_ROOT)
+        self.state = _READONLY_STATE
+
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+class TestUserPerspective(_TmpRootTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # UserPerspective never writes under root, so tests that only need
+        # a valid README can read one shared project.
+        cls.readme_dir = tempfile.mkdtemp(dir=_TEST_ROOT)
+        (Path(cls.readme_dir) / "README.md").write_bytes(_LONG_README)
 
     def test_no_readme_critical_prompt(self):
         analyzer = UserPerspective(Path(self.tmp_dir), self.state)
@@ -43,44 +87,56 @@ class TestUserPerspective(unittest.TestCase):
         self.assertIn("README", critical[0].title)
 
     def test_with_readme(self):
-        (Path(self.tmp_dir) / "README.md").write_text("# Project\n" + "x" * 5000)
-        analyzer = UserPerspective(Path(self.tmp_dir), self.state)
+        analyzer = UserPerspective(Path(self.readme_dir), self.state)
         metrics, prompts = analyzer.analyze()
-        critical = [p for p in prompts if p.priority == Priority.CRITICAL]
-        self.assertEqual(len(critical), 0)
+        self.assertFalse(_has_priority(prompts, Priority.CRITICAL))
         self.assertGreater(metrics["documentation_quality"], 0.5)
 
+    def test_large_readme_full_score(self):
+        (Path(self.tmp_dir) / "README.md").write_bytes(b"# Big\n" + b"x" * 20000)
+        analyzer = UserPerspective(Path(self.tmp_dir), self.state)
+        metrics, prompts = analyzer.analyze()
+        self.assertEqual(metrics["documentation_quality"], 1.0)
+        self.assertFalse(_has_priority(prompts, Priority.HIGH))
+
     def test_short_readme_high_prompt(self):
         (Path(self.tmp_dir) / "README.md").write_text("# Hi")
         analyzer = UserPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
-        high = [p for p in prompts if p.priority == Priority.HIGH]
-        self.assertGreater(len(high), 0)
+        self.assertTrue(_has_priority(prompts, Priority.HIGH))
 
     def test_package_json_with_description(self):
-        (Path(self.tmp_dir) / "README.md").write_text("# Project\n" + "x" * 5000)
-        (Path(self.tmp_dir) / "package.json").write_text(
-            json.dumps({"name": "test", "description": "A test project"})
-        )
+        _materialize(self.tmp_dir, {
+            "README.md": _LONG_README,
+            "package.json": _PACKAGE_JSON,
+        })
         analyzer = UserPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertGreater(metrics["usability"], 0.5)
 
     def test_package_json_without_description(self):
-        (Path(self.tmp_dir) / "README.md").write_text("# Project\n" + "x" * 5000)
-        (Path(self.tmp_dir) / "package.json").write_text(
-            json.dumps({"name": "test"})
-        )
+        _materialize(self.tmp_dir, {
+            "README.md": _LONG_README,
+            "package.json": _PACKAGE_JSON_NO_DESCRIPTION,
+        })
+        analyzer = UserPerspective(Path(self.tmp_dir), self.state)
+        metrics, prompts = analyzer.analyze()
+        self.assertTrue(_has_priority(prompts, Priority.MEDIUM))
+
+    def test_package_json_undecodable(self):
+        _materialize(self.tmp_dir, {
+            "README.md": _LONG_README,
+            "package.json": b'{"name": "\xff"}',
+        })
         analyzer = UserPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
-        medium = [p for p in prompts if p.priority == Priority.MEDIUM]
-        self.assertGreater(len(medium), 0)
+        self.assertEqual(metrics["usability"], 0.0)
 
     def test_increment_tracker_replaces_requirements_parsing(self):
         """User perspective should no longer parse requirements.md."""
-        (Path(self.tmp_dir) / "README.md").write_text("# Project\n" + "x" * 5000)
         req_content = "# Reqs\n### R1: First\nDo something.\n### R2: Second\nDo more.\n"
-        (Path(self.tmp_dir) / "requirements.md").write_text(req_content)
+        _materialize(self.tmp_dir, {
+            "README.md": _LONG_README, "requirements.md": req_content})
         analyzer = UserPerspective(Path(self.tmp_dir), self.state)
         _, prompts = analyzer.analyze()
         # No requirement-tagged prompts should appear since requirements parsing
@@ -90,37 +146,25 @@ class TestUserPerspective(unittest.TestCase):
 
     def test_user_perspective_without_requirements_md(self):
         """User perspective should work fine without requirements.md."""
-        (Path(self.tmp_dir) / "README.md").write_text("# Project\n" + "x" * 5000)
-        analyzer = UserPerspective(Path(self.tmp_dir), self.state)
+        analyzer = UserPerspective(Path(self.readme_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertIsInstance(metrics, dict)
         self.assertIn("documentation_quality", metrics)
         self.assertIsInstance(prompts, list)
 
 
-class TestTestPerspective(unittest.TestCase):
-
-    def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-        self.state = OrganismState()
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+class TestTestPerspective(_TmpRootTestCase):
 
     def test_no_test_dir_critical(self):
         analyzer = TestPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertEqual(metrics["code_coverage"], 0.0)
-        critical = [p for p in prompts if p.priority == Priority.CRITICAL]
-        self.assertGreater(len(critical), 0)
+        self.assertTrue(_has_priority(prompts, Priority.CRITICAL))
 
     def test_nested_test_dir_found(self):
         """Test dirs inside sub-directories should be detected."""
-        subpkg = Path(self.tmp_dir) / "mypackage"
-        subpkg.mkdir()
-        tests_dir = subpkg / "tests"
-        tests_dir.mkdir()
-        (tests_dir / "test_core.py").write_text("def test_core(): pass")
+        _materialize(self.tmp_dir, {
+            "mypackage/tests/test_core.py": "def test_core(): pass"})
         analyzer = TestPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         critical = [p for p in prompts if p.priority == Priority.CRITICAL
@@ -128,45 +172,29 @@ class TestTestPerspective(unittest.TestCase):
         self.assertEqual(len(critical), 0, "Should NOT ask to create test dir when nested tests/ exists")
 
     def test_with_test_dir(self):
-        (Path(self.tmp_dir) / "tests").mkdir()
-        (Path(self.tmp_dir) / "tests" / "test_a.py").write_text("def test_a(): pass")
+        _materialize(self.tmp_dir, {"tests/test_a.py": "def test_a(): pass"})
         analyzer = TestPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertGreater(metrics["code_coverage"], 0.0)
 
     def test_with_source_and_test_files(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "module.py").write_text("def func(): pass")
-        tests = Path(self.tmp_dir) / "tests"
-        tests.mkdir()
-        (tests / "test_module.py").write_text("def test_func(): pass")
+        _materialize(self.tmp_dir, {
+            "src/module.py": "def func(): pass",
+            "tests/test_module.py": "def test_func(): pass",
+        })
         analyzer = TestPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertGreater(metrics["code_coverage"], 0.0)
 
     def test_low_coverage_prompt(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        for i in range(5):
-            (src / f"module_{i}.py").write_text(f"def func_{i}(): pass")
-        tests = Path(self.tmp_dir) / "tests"
-        tests.mkdir()
-        (tests / "test_one.py").write_text("def test_one(): pass")
+        _materialize(self.tmp_dir, {
+            **_SMALL_MODULES, "tests/test_one.py": "def test_one(): pass"})
         analyzer = TestPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
-        high = [p for p in prompts if p.priority == Priority.HIGH]
-        self.assertGreater(len(high), 0)
-
+        self.assertTrue(_has_priority(prompts, Priority.HIGH))
 
-class TestSystemPerspective(unittest.TestCase):
-
-    def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-        self.state = OrganismState()
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+class TestSystemPerspective(_TmpRootTestCase):
 
     def test_no_files_info_prompt(self):
         analyzer = SystemPerspective(Path(self.tmp_dir), self.state)
@@ -176,30 +204,22 @@ class TestSystemPerspective(unittest.TestCase):
         self.assertEqual(prompts[0].priority, Priority.INFO)
 
     def test_with_source_files(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "module.py").write_text("def func(): pass")
+        _materialize(self.tmp_dir, {"src/module.py": "def func(): pass"})
         analyzer = SystemPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         self.assertGreater(metrics["complexity"], 0.0)
 
     def test_long_file_refactor_prompt(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "big.py").write_text("\n".join(["x = 1"] * 400))
-        analyzer = SystemPerspective(Path(self.tmp_dir), self.state)
+        _materialize(self.tmp_dir, {"src/big.py": _LONG_MODULE})
+        # Lower the limit through config instead of writing a 300+ line file.
+        analyzer = SystemPerspective(Path(self.tmp_dir), self.state,
+                                     config={"max_file_lines": 5})
         metrics, prompts = analyzer.analyze()
         refactor = [p for p in prompts if "Refactor" in p.title]
         self.assertGreater(len(refactor), 0)
 
     def test_high_complexity_prompt(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        lines = ["def func():"]
-        for i in range(15):
-            lines.append(f"    if x == {i}:")
-            lines.append(f"        return {i}")
-        (src / "complex.py").write_text("\n".join(lines))
+        _materialize(self.tmp_dir, {"src/complex.py": _COMPLEX_MODULE})
         analyzer = SystemPerspective(Path(self.tmp_dir), self.state)
         metrics, prompts = analyzer.analyze()
         complexity_prompts = [p for p in prompts if "complexity" in p.title.lower()]
@@ -207,16 +227,14 @@ class TestSystemPerspective(unittest.TestCase):
 
 
 class TestAnalyticsPerspective(unittest.TestCase):
+    """AnalyticsPerspective reads only state and git, never the tree."""
 
     def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+        self.root = Path(_TEST_ROOT)
+        self.state = _READONLY_STATE
 
     def test_insufficient_history(self):
-        state = OrganismState()
-        analyzer = AnalyticsPerspective(Path(self.tmp_dir), state)
+        analyzer = AnalyticsPerspective(self.root, self.state)
         analyzer.git_analyzer = _mock_git_analyzer()
         metrics, prompts = analyzer.analyze()
         self.assertEqual(metrics["error_rate_trends"], 0.5)
@@ -224,12 +242,8 @@ class TestAnalyticsPerspective(unittest.TestCase):
 
     def test_with_history_declining_trend(self):
         state = OrganismState()
-        state.fitness_history = [
-            {"overall": 0.8, "generation": i} for i in range(6)
-        ] + [
-            {"overall": 0.4, "generation": i} for i in range(6, 11)
-        ]
-        analyzer = AnalyticsPerspective(Path(self.tmp_dir), state)
+        state.fitness_history = list(_DECLINING_HISTORY)
+        analyzer = AnalyticsPerspective(self.root, state)
         analyzer.git_analyzer = _mock_git_analyzer()
         metrics, prompts = analyzer.analyze()
         declining = [p for p in prompts if "declining" in p.title.lower()]
@@ -237,12 +251,8 @@ class TestAnalyticsPerspective(unittest.TestCase):
 
     def test_with_history_improving_trend(self):
         state = OrganismState()
-        state.fitness_history = [
-            {"overall": 0.3, "generation": i} for i in range(6)
-        ] + [
-            {"overall": 0.8, "generation": i} for i in range(6, 11)
-        ]
-        analyzer = AnalyticsPerspective(Path(self.tmp_dir), state)
+        state.fitness_history = list(_IMPROVING_HISTORY)
+        analyzer = AnalyticsPerspective(self.root, state)
         analyzer.git_analyzer = _mock_git_analyzer()
         metrics, prompts = analyzer.analyze()
         positive = [p for p in prompts if "positive" in p.title.lower() or "Positive" in p.title]
@@ -250,32 +260,22 @@ class TestAnalyticsPerspective(unittest.TestCase):
 
     def test_high_fix_rate_prompt(self):
         state = OrganismState()
-        state.fitness_history = [
-            {"overall": 0.5, "generation": i} for i in range(3)
-        ]
-        mock_git = _mock_git_analyzer()
-        mock_git.get_recent_commits.return_value = [
+        state.fitness_history = list(_FLAT_HISTORY)
+        mock_git = _StubGit(commits=[
             {"hash": f"abc{i}", "message": f"fix bug {i}", "date": "2026-01-01"}
             for i in range(8)
         ] + [
             {"hash": "def0", "message": "add feature", "date": "2026-01-01"},
             {"hash": "def1", "message": "update docs", "date": "2026-01-01"},
-        ]
-        analyzer = AnalyticsPerspective(Path(self.tmp_dir), state)
+        ])
+        analyzer = AnalyticsPerspective(self.root, state)
         analyzer.git_analyzer = mock_git
         metrics, prompts = analyzer.analyze()
         fix_rate = [p for p in prompts if "fix rate" in p.title.lower() or "bug fix" in p.title.lower()]
         self.assertGreater(len(fix_rate), 0)
 
 
-class TestDebugPerspective(unittest.TestCase):
-
-    def setUp(self):
-        self.tmp_dir = tempfile.mkdtemp()
-        self.state = OrganismState()
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+class TestDebugPerspective(_TmpRootTestCase):
 
     def test_clean_debug(self):
         analyzer = DebugPerspective(Path(self.tmp_dir), self.state)
@@ -284,8 +284,7 @@ class TestDebugPerspective(unittest.TestCase):
         self.assertGreater(metrics["error_count"], 0.5)
 
     def test_uncommitted_changes(self):
-        mock_git = _mock_git_analyzer()
-        mock_git.get_uncommitted_changes.return_value = [" M file.py", "?? new.py"]
+        mock_git = _StubGit(uncommitted=[" M file.py", "?? new.py"])
         analyzer = DebugPerspective(Path(self.tmp_dir), self.state)
         analyzer.git_analyzer = mock_git
         metrics, prompts = analyzer.analyze()
@@ -293,9 +292,8 @@ class TestDebugPerspective(unittest.TestCase):
         self.assertGreater(len(uncommitted), 0)
 
     def test_todo_detection(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        (src / "module.py").write_text("# TODO: Fix this\ndef func(): pass\n# FIXME: broken")
+        _materialize(self.tmp_dir, {
+            "src/module.py": "# TODO: Fix this\ndef func(): pass\n# FIXME: broken"})
         analyzer = DebugPerspective(Path(self.tmp_dir), self.state)
         analyzer.git_analyzer = _mock_git_analyzer()
         metrics, prompts = analyzer.analyze()
@@ -303,10 +301,7 @@ class TestDebugPerspective(unittest.TestCase):
         self.assertGreater(len(todo_prompts), 0)
 
     def test_fitness_decreases_with_issues(self):
-        src = Path(self.tmp_dir) / "src"
-        src.mkdir()
-        todos = "\n".join([f"# TODO: item {i}" for i in range(15)])
-        (src / "module.py").write_text(todos)
+        _materialize(self.tmp_dir, {"src/module.py": _TODO_BLOB})
         analyzer = DebugPerspective(Path(self.tmp_dir), self.state)
         analyzer.git_analyzer = _mock_git_analyzer()
         metrics, prompts = analyzer.analyze()
@@ -1,18 +1,19 @@
 """Tests for --revert, --revert_from, and --redo functionality."""
 
 import shutil
-import subprocess
 import sys
 import tempfile
 import textwrap
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from analyzers import GitAnalyzer
 from increment_tracker import IncrementTracker
+from organism import main as _organism_main
 
 
 def _assert_current_workflow(testcase: unittest.TestCase, output: str) -> None:
@@ -21,56 +22,77 @@ def _assert_current_workflow(testcase: unittest.TestCase, output: str) -> None:
     testcase.assertNotIn("./develop.sh", output)
 
 
+_INCREMENT_TEMPLATE = textwrap.dedent("""\
+    # Increment {number:04d}: Test Feature {number}
+
+    **Requirement ID:** R{number}
+
+    ## Description
+    Implement test feature {number}.
+
+    ## Acceptance Criteria
+    - [ ] Feature {number} works correctly
+    - [ ] Tests pass
+
+    ## Related Principles
+    - [B1](../how/B1.md)
+""")
+_B1_BYTES = "# B1 — Principle\nContent.".encode("utf-8")
+
+
 def _make_increment_file(req_dir: Path, number: int, status: str = "todo",
                          short_desc: str = "test_feature") -> Path:
     """Create a minimal increment markdown file and return its path."""
     filename = f"increment_{number:04d}_{status}_{short_desc}.md"
     path = req_dir / filename
-    content = textwrap.dedent(f"""\
-        # Increment {number:04d}: Test Feature {number}
-
-        **Requirement ID:** R{number}
+    path.write_bytes(_INCREMENT_TEMPLATE.format(number=number).encode("utf-8"))
+    return path
 
-        ## Description
-        Implement test feature {number}.
 
-        ## Acceptance Criteria
-        - [ ] Feature {number} works correctly
-        - [ ] Tests pass
+class _TrackerTestCase(unittest.TestCase):
+    """One todo/how skeleton per class; setUp only empties todo/."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = Path(tempfile.mkdtemp())
+        cls.req_dir = cls.tmp_dir / "todo"
+        cls.req_dir.mkdir()
+        cls.prin_dir = cls.tmp_dir / "how"
+        cls.prin_dir.mkdir()
+        (cls.prin_dir / "B1.md").write_bytes(_B1_BYTES)
+        cls.tracker = IncrementTracker(cls.tmp_dir)
+        # Patch the git lookups once per class; setUp resets them per test.
+        for name, attr in (("mock_commits", "get_commits_for_increment"),
+                           ("mock_diff", "get_diff_for_commit")):
+            patcher = patch.object(GitAnalyzer, attr)
+            setattr(cls, name, patcher.start())
+            cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
 
-        ## Related Principles
-        - [B1](../how/B1.md)
-    """)
-    path.write_text(content, encoding="utf-8")
-    return path
+    def setUp(self):
+        for path in self.req_dir.iterdir():
+            path.unlink()
+        self.mock_commits.reset_mock(return_value=True, side_effect=True)
+        self.mock_commits.return_value = []
+        self.mock_diff.reset_mock(return_value=True, side_effect=True)
+        self.mock_diff.return_value = ""
 
 
-class TestIncrementTrackerRevert(unittest.TestCase):
+class TestIncrementTrackerRevert(_TrackerTestCase):
     """Tests for IncrementTracker.format_revert_prompt."""
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
-        self.req_dir = self.tmp_dir / "todo"
-        self.req_dir.mkdir()
-        self.prin_dir = self.tmp_dir / "how"
-        self.prin_dir.mkdir()
-        (self.prin_dir / "B1.md").write_text("# B1 — Principle\nContent.")
-        self.tracker = IncrementTracker(self.tmp_dir)
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_revert_prompt_with_commits(self, mock_diff, mock_commits):
+    def test_revert_prompt_with_commits(self):
         """--revert=0001 generates a prompt listing related git commits."""
         _make_increment_file(self.req_dir, 1, status="done")
 
-        mock_commits.return_value = [
+        self.mock_commits.return_value = [
             {"hash": "aaa11111", "message": "INCREMENT 0001: Test Feature 1",
              "date": "2026-01-01"},
         ]
-        mock_diff.return_value = " file1.py | 10 ++++\n 1 file changed"
+        self.mock_diff.return_value = " file1.py | 10 ++++\n 1 file changed"
 
         output = self.tracker.format_revert_prompt(1)
 
@@ -81,12 +103,10 @@ class TestIncrementTrackerRevert(unittest.TestCase):
         self.assertIn("REVERT INCREMENT 0001", output)
         _assert_current_workflow(self, output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_revert_prompt_no_commits(self, mock_diff, mock_commits):
+    def test_revert_prompt_no_commits(self):
         """--revert produces helpful output even when no commits are found."""
         _make_increment_file(self.req_dir, 5)
-        mock_commits.return_value = []
+        self.mock_commits.return_value = []
 
         output = self.tracker.format_revert_prompt(5)
 
@@ -95,34 +115,30 @@ class TestIncrementTrackerRevert(unittest.TestCase):
         self.assertIn("Search manually", output)
         _assert_current_workflow(self, output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_revert_prompt_done_file_rename_hint(self, mock_diff, mock_commits):
+    def test_revert_prompt_done_file_rename_hint(self):
         """Revert prompt for a done increment suggests renaming back to todo."""
         _make_increment_file(self.req_dir, 2, status="done")
-        mock_commits.return_value = [
+        self.mock_commits.return_value = [
             {"hash": "bbb22222", "message": "INCREMENT 0002: done",
              "date": "2026-01-02"},
         ]
-        mock_diff.return_value = ""
+        self.mock_diff.return_value = ""
 
         output = self.tracker.format_revert_prompt(2)
 
         self.assertIn("POST-REVERT", output)
         self.assertIn("_todo_", output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_revert_prompt_multiple_commits(self, mock_diff, mock_commits):
+    def test_revert_prompt_multiple_commits(self):
         """Revert prompt lists multiple commits in order."""
         _make_increment_file(self.req_dir, 3, status="done")
-        mock_commits.return_value = [
+        self.mock_commits.return_value = [
             {"hash": "ccc33333", "message": "INCREMENT 0003: part 2",
              "date": "2026-01-03"},
             {"hash": "ccc33331", "message": "INCREMENT 0003: part 1",
              "date": "2026-01-02"},
         ]
-        mock_diff.return_value = ""
+        self.mock_diff.return_value = ""
 
         output = self.tracker.format_revert_prompt(3)
 
@@ -132,22 +148,10 @@ class TestIncrementTrackerRevert(unittest.TestCase):
         self.assertEqual(output.count("git revert --no-commit"), 2)
 
 
-class TestIncrementTrackerRevertFrom(unittest.TestCase):
+class TestIncrementTrackerRevertFrom(_TrackerTestCase):
     """Tests for IncrementTracker.format_revert_from_prompt."""
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
-        self.req_dir = self.tmp_dir / "todo"
-        self.req_dir.mkdir()
-        self.prin_dir = self.tmp_dir / "how"
-        self.prin_dir.mkdir()
-        self.tracker = IncrementTracker(self.tmp_dir)
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    def test_revert_from_to_current_todo(self, mock_commits):
+    def test_revert_from_to_current_todo(self):
         """--revert_from=0005 with current todo at 0003 covers 0005→0003."""
         # Increments 1-2 done, 3-5 todo
         _make_increment_file(self.req_dir, 1, status="done")
@@ -156,7 +160,7 @@ class TestIncrementTrackerRevertFrom(unittest.TestCase):
         _make_increment_file(self.req_dir, 4, status="todo")
         _make_increment_file(self.req_dir, 5, status="todo")
 
-        mock_commits.return_value = []
+        self.mock_commits.return_value = []
 
         output = self.tracker.format_revert_from_prompt(5)
 
@@ -168,8 +172,7 @@ class TestIncrementTrackerRevertFrom(unittest.TestCase):
         self.assertIn("INCREMENT 0003", output)
         _assert_current_workflow(self, output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    def test_revert_from_lists_commits_per_increment(self, mock_commits):
+    def test_revert_from_lists_commits_per_increment(self):
         """Each increment in range shows its own commits."""
         _make_increment_file(self.req_dir, 1, status="todo")
         _make_increment_file(self.req_dir, 2, status="todo")
@@ -180,21 +183,20 @@ class TestIncrementTrackerRevertFrom(unittest.TestCase):
                          "date": "2026-01-01"}]
             return []
 
-        mock_commits.side_effect = side_effect
+        self.mock_commits.side_effect = side_effect
 
         output = self.tracker.format_revert_from_prompt(2)
 
         self.assertIn("ddd44444", output)
         self.assertIn("(no commits found)", output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    def test_revert_from_all_done(self, mock_commits):
+    def test_revert_from_all_done(self):
         """When all increments are done, revert_from still works."""
         _make_increment_file(self.req_dir, 1, status="done")
         _make_increment_file(self.req_dir, 2, status="done")
         _make_increment_file(self.req_dir, 3, status="done")
 
-        mock_commits.return_value = []
+        self.mock_commits.return_value = []
 
         output = self.tracker.format_revert_from_prompt(3)
 
@@ -203,33 +205,18 @@ class TestIncrementTrackerRevertFrom(unittest.TestCase):
         self.assertIn("STEPS", output)
 
 
-class TestIncrementTrackerRedo(unittest.TestCase):
+class TestIncrementTrackerRedo(_TrackerTestCase):
     """Tests for IncrementTracker.format_redo_prompt."""
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
-        self.req_dir = self.tmp_dir / "todo"
-        self.req_dir.mkdir()
-        self.prin_dir = self.tmp_dir / "how"
-        self.prin_dir.mkdir()
-        (self.prin_dir / "B1.md").write_text("# B1 — Principle\nContent.")
-        self.tracker = IncrementTracker(self.tmp_dir)
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_redo_prompt_contains_revert_and_implement(self, mock_diff,
-                                                       mock_commits):
+    def test_redo_prompt_contains_revert_and_implement(self):
         """--redo=0001 includes both revert instructions and the requirement."""
         _make_increment_file(self.req_dir, 1, status="done")
 
-        mock_commits.return_value = [
+        self.mock_commits.return_value = [
             {"hash": "eee55555", "message": "INCREMENT 0001: done",
              "date": "2026-01-01"},
         ]
-        mock_diff.return_value = ""
+        self.mock_diff.return_value = ""
 
         output = self.tracker.format_redo_prompt(1)
 
@@ -249,23 +236,19 @@ class TestIncrementTrackerRedo(unittest.TestCase):
         self.assertIn("./todo.sh", output)
         _assert_current_workflow(self, output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_redo_prompt_includes_principles(self, mock_diff, mock_commits):
+    def test_redo_prompt_includes_principles(self):
         """Redo prompt resolves and includes applicable principles."""
         _make_increment_file(self.req_dir, 1, status="todo")
-        mock_commits.return_value = []
+        self.mock_commits.return_value = []
 
         output = self.tracker.format_redo_prompt(1)
 
         self.assertIn("APPLICABLE PRINCIPLES:", output)
         self.assertIn("B1", output)
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment")
-    @patch.object(GitAnalyzer, "get_diff_for_commit")
-    def test_redo_prompt_nonexistent_increment(self, mock_diff, mock_commits):
+    def test_redo_prompt_nonexistent_increment(self):
         """Redo for a non-existent increment gives a fallback message."""
-        mock_commits.return_value = []
+        self.mock_commits.return_value = []
 
         output = self.tracker.format_redo_prompt(99)
 
@@ -276,19 +259,21 @@ class TestIncrementTrackerRedo(unittest.TestCase):
 class TestGitAnalyzerIncrementMethods(unittest.TestCase):
     """Tests for GitAnalyzer methods used by revert/redo."""
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
+    @classmethod
+    def setUpClass(cls):
+        # subprocess.run is mocked, so the directory is only passed as cwd.
+        cls.tmp_dir = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
 
     @patch("subprocess.run")
     def test_get_commits_for_increment(self, mock_run):
         """get_commits_for_increment searches git log for increment tag."""
-        mock_result1 = MagicMock()
-        mock_result1.stdout = "aaa111|INCREMENT 0001: feat|2026-01-01"
-        mock_result2 = MagicMock()
-        mock_result2.stdout = ""
+        mock_result1 = SimpleNamespace(
+            stdout="aaa111|INCREMENT 0001: feat|2026-01-01")
+        mock_result2 = SimpleNamespace(stdout="")
 
         mock_run.side_effect = [mock_result1, mock_result2]
 
@@ -302,8 +287,8 @@ class TestGitAnalyzerIncrementMethods(unittest.TestCase):
     @patch("subprocess.run")
     def test_get_commits_for_increment_deduplicates(self, mock_run):
         """Same commit found by both search patterns is not duplicated."""
-        mock_result = MagicMock()
-        mock_result.stdout = "aaa111|INCREMENT 0001: feat|2026-01-01"
+        mock_result = SimpleNamespace(
+            stdout="aaa111|INCREMENT 0001: feat|2026-01-01")
 
         mock_run.side_effect = [mock_result, mock_result]
 
@@ -315,8 +300,8 @@ class TestGitAnalyzerIncrementMethods(unittest.TestCase):
     @patch("subprocess.run")
     def test_get_diff_for_commit(self, mock_run):
         """get_diff_for_commit returns stat output."""
-        mock_result = MagicMock()
-        mock_result.stdout = " file.py | 5 +++++\n 1 file changed"
+        mock_result = SimpleNamespace(
+            stdout=" file.py | 5 +++++\n 1 file changed")
         mock_run.return_value = mock_result
 
         analyzer = GitAnalyzer(self.tmp_dir)
@@ -331,17 +316,14 @@ class TestGitAnalyzerIncrementMethods(unittest.TestCase):
 
         def side_effect(*args, **kwargs):
             call_count[0] += 1
-            result = MagicMock()
             # Alternate between returning a commit and empty
             cmd = args[0]
             grep_arg = [a for a in cmd if a.startswith("--grep=")]
             if grep_arg and "0001" in grep_arg[0]:
-                result.stdout = "aaa111|INCREMENT 0001|2026-01-01"
-            elif grep_arg and "0002" in grep_arg[0]:
-                result.stdout = "bbb222|INCREMENT 0002|2026-01-02"
-            else:
-                result.stdout = ""
-            return result
+                return SimpleNamespace(stdout="aaa111|INCREMENT 0001|2026-01-01")
+            if grep_arg and "0002" in grep_arg[0]:
+                return SimpleNamespace(stdout="bbb222|INCREMENT 0002|2026-01-02")
+            return SimpleNamespace(stdout="")
 
         mock_run.side_effect = side_effect
 
@@ -354,49 +336,42 @@ class TestGitAnalyzerIncrementMethods(unittest.TestCase):
 class TestCLIRevertRedoArgs(unittest.TestCase):
     """Tests for organism.py CLI argument parsing for revert/redo."""
 
-    def setUp(self):
-        self.tmp_dir = Path(tempfile.mkdtemp())
-        self.req_dir = self.tmp_dir / "todo"
-        self.req_dir.mkdir()
-        self.prin_dir = self.tmp_dir / "how"
-        self.prin_dir.mkdir()
-
-    def tearDown(self):
-        shutil.rmtree(self.tmp_dir)
-
-    @patch.object(GitAnalyzer, "get_commits_for_increment", return_value=[])
-    @patch.object(GitAnalyzer, "get_diff_for_commit", return_value="")
-    def test_cli_revert_arg(self, mock_diff, mock_commits):
-        """organism.py --revert=0001 invokes format_revert_prompt."""
-        _make_increment_file(self.req_dir, 1)
-
-        from organism import main
-        with patch("sys.argv", ["organism.py", "--revert=0001",
-                                f"--root={self.tmp_dir}"]):
+    @classmethod
+    def setUpClass(cls):
+        # The revert/redo paths of main() only read the tree, so every
+        # test runs against one root holding todo increments 1 and 5.
+        cls.tmp_dir = Path(tempfile.mkdtemp())
+        cls.req_dir = cls.tmp_dir / "todo"
+        cls.req_dir.mkdir()
+        (cls.tmp_dir / "how").mkdir()
+        _make_increment_file(cls.req_dir, 1)
+        _make_increment_file(cls.req_dir, 5)
+        for attr, value in (("get_commits_for_increment", []),
+                            ("get_diff_for_commit", "")):
+            patcher = patch.object(GitAnalyzer, attr, return_value=value)
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_dir, ignore_errors=True)
+
+    def _main(self, arg):
+        with patch("sys.argv", ["organism.py", arg, f"--root={self.tmp_dir}"]):
             # Should not raise
-            main()
+            _organism_main()
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment", return_value=[])
-    def test_cli_revert_from_arg(self, mock_commits):
-        """organism.py --revert_from=0005 invokes format_revert_from_prompt."""
-        _make_increment_file(self.req_dir, 1, status="todo")
-        _make_increment_file(self.req_dir, 5, status="todo")
+    def test_cli_revert_arg(self):
+        """organism.py --revert=0001 invokes format_revert_prompt."""
+        self._main("--revert=0001")
 
-        from organism import main
-        with patch("sys.argv", ["organism.py", "--revert_from=0005",
-                                f"--root={self.tmp_dir}"]):
-            main()
+    def test_cli_revert_from_arg(self):
+        """organism.py --revert_from=0005 invokes format_revert_from_prompt."""
+        self._main("--revert_from=0005")
 
-    @patch.object(GitAnalyzer, "get_commits_for_increment", return_value=[])
-    @patch.object(GitAnalyzer, "get_diff_for_commit", return_value="")
-    def test_cli_redo_arg(self, mock_diff, mock_commits):
+    def test_cli_redo_arg(self):
         """organism.py --redo=0001 invokes format_redo_prompt."""
-        _make_increment_file(self.req_dir, 1)
-
-        from organism import main
-        with patch("sys.argv", ["organism.py", "--redo=0001",
-                                f"--root={self.tmp_dir}"]):
-            main()
+        self._main("--redo=0001")
 
 
 if __name__ == "__main__":
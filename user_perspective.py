@@ -6,11 +6,9 @@ Requirements checking is now handled by the increment tracker.
 """
 
 import json
-from pathlib import Path
 from typing import Dict, List, Tuple
 
 from models import (
-    OrganismState,
     Perspective,
     Priority,
     Prompt,
@@ -46,7 +44,9 @@ class UserPerspective(PerspectiveAnalyzer):
 
     def _check_readme(self, fitness_components, prompts):
         readme_path = self.root_dir / "README.md"
-        if not readme_path.exists():
+        try:
+            size = readme_path.stat().st_size
+        except FileNotFoundError:
             fitness_components.append(0.0)
             prompts.append(Prompt(
                 perspective=Perspective.USER,
@@ -65,19 +65,25 @@ class UserPerspective(PerspectiveAnalyzer):
             ))
             return
 
-        content = readme_path.read_text()
-        score = min(1.0, len(content) / 5000)
+        # No text encoding spends more than 4 bytes per character, so a
+        # file this large already holds the 5000 chars for a full score.
+        if size >= 4 * 5000:
+            fitness_components.append(1.0)
+            return
+
+        length = len(readme_path.read_text(encoding="utf-8", errors="replace"))
+        score = min(1.0, length / 5000)
         fitness_components.append(score)
-        if len(content) < 500:
+        if length < 500:
             prompts.append(Prompt(
                 perspective=Perspective.USER,
                 priority=Priority.HIGH,
                 title="Enhance README documentation",
                 description="README.md is minimal. Add installation instructions, usage examples, and feature descriptions.",
                 file_path="README.md",
-                metric_current=len(content),
+                metric_current=length,
                 metric_target=2000,
-                evaluative_evidence=f"README.md length is {len(content)} chars (<500 chars)",
+                evaluative_evidence=f"README.md length is {length} chars (<500 chars)",
                 directive_evidence="Expand the README.md with more comprehensive usage and feature details",
                 expected_next_state="README.md length > 2000 chars",
                 acceptance_criteria=[
@@ -85,16 +91,17 @@ class UserPerspective(PerspectiveAnalyzer):
                     "Add at least 2 usage examples",
                     "Document main features"
                 ],
-                reason=f"README.md is only {len(content)} chars, below 500-char minimum"
+                reason=f"README.md is only {length} chars, below 500-char minimum"
             ))
 
     def _check_package_json(self, fitness_components, prompts):
         package_json = self.root_dir / "package.json"
-        if not package_json.exists():
-            return
         try:
-            pkg = json.loads(package_json.read_text())
-        except json.JSONDecodeError:
+            # json detects UTF-8/16/32 from the bytes; no locale decode.
+            pkg = json.loads(package_json.read_bytes())
+        except FileNotFoundError:
+            return
+        except ValueError:  # JSONDecodeError or UnicodeDecodeError
             fitness_components.append(0.0)
             return
         if pkg.get("description"):